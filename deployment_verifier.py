@@ -403,8 +403,10 @@ def main():
             with open(args.config, 'r') as f:
                 for line in f:
                     line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
+                    if not line or line.startswith('#'):
+                        continue
+                    key, sep, value = line.partition('=')
+                    if sep:
                         config[key.strip()] = value.strip().strip('"')
 
         # Override with command line arguments
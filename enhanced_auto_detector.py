@@ -6,145 +6,616 @@ Complete solution for directory change handling, contract discovery, deployment
 
 import os
 import sys
+import copy
 import json
+import functools
+import itertools
+import logging
+import importlib.util
 import time
 import hashlib
+import mmap
 import re
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import AbstractSet, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
 from datetime import datetime
+
+from stx_units import MICRO_STX, parse_micro_stx
+
+logger = logging.getLogger(__name__)
+
+# TOML parser resolved once: stdlib tomllib (3.11+), then the toml package;
+# with neither, Clarinet.toml is parsed by hand
+try:
+    import tomllib
+    toml = None
+except ImportError:
+    tomllib = None
+    try:
+        import toml
+    except ImportError:
+        toml = None
+
+# Optional fast JSON codec; stdlib json is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional incremental JSON parser so manifests are not loaded whole
+HAS_IJSON = importlib.util.find_spec('ijson') is not None
+
+# Optional Aho-Corasick matcher for category and priority lookups
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional non-cryptographic hasher for change detection; md5 is the fallback
+try:
+    import xxhash
+    _new_file_hasher = xxhash.xxh3_64
+except ImportError:
+    _new_file_hasher = hashlib.md5
+
+MMAP_HASH_THRESHOLD = 64 * 1024  # Files larger than this are hashed through mmap
+STATE_COMPACT_EVERY = 1000  # State log entries before the snapshot is rewritten
+MANIFEST_READ_WORKERS = 8  # Threads used to read manifest and artifact files
+
+# Directories never worth descending into when looking for contracts
+SKIP_DIRS = frozenset({'.git', 'node_modules', 'target', '.venv', '__pycache__'})
+
+
+def _scan_files(directory: Path, suffixes: Tuple[str, ...]) -> Iterator[os.DirEntry]:
+    """Yield file entries ending in one of suffixes from a single pruned scandir walk"""
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffixes) and entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+
+
+def _dir_mtimes(directory: Path, skip: AbstractSet[str] = SKIP_DIRS) -> Dict[str, int]:
+    """mtime of every directory under directory not pruned by skip, keyed by path"""
+    mtimes = {}
+    stack = [os.fspath(directory)]
+    while stack:
+        path = stack.pop()
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in skip:
+                        stack.append(entry.path)
+                except OSError:
+                    continue
+    return mtimes
+
+
+# Deployment complexity multiplier per contract category; others count 1.0
+_GAS_MULT = MappingProxyType({
+    'defi': 1.8, 'dao': 1.8,
+    'tokens': 1.3, 'oracle': 1.3,
+    'security': 1.1, 'utilities': 1.1
+})
+
+# Hiro API endpoints for wallet balance checks
+_API_URLS = MappingProxyType({
+    'mainnet': 'https://api.hiro.so',
+    'testnet': 'https://api.testnet.hiro.so',
+    'devnet': 'http://localhost:20443'
+})
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) seconds for Hiro API calls
+
+# One requests.Session per thread so balance checks reuse TLS connections;
+# sessions are not safe to share across threads
+_thread_sessions = threading.local()
+
+# KEY=VALUE lines of a .env file with surrounding blanks trimmed; comment
+# lines and lines without '=' never match
+_ENV_LINE_RE = re.compile(r'^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+# Optionally quoted SYSTEM_ADDRESS value: 'S' plus 40 more characters
+_ADDRESS_RE = re.compile(r'["\']?(S[A-Z0-9]{40})["\']?')
+
+# Configuration files checked in order (including Conxian .env); first one wins
+CONFIG_FILE_NAMES = ('.env', 'config.env', '.stacksorbit.env')
+
+# Local deployment records: matched by file name anywhere in the tree, or by
+# exact path relative to the project root
+HISTORY_FILE_NAMES = frozenset({'deployment_history.json'})
+HISTORY_FILE_PATHS = frozenset({'deployment/history.json'})
+MANIFEST_FILE_NAMES = frozenset({'testnet-manifest.json', 'mainnet-manifest.json'})
+MANIFEST_FILE_PATHS = frozenset({'deployment/manifest.json', '.stacksorbit/manifest.json'})
+
+
+def _is_deployment_json(relative_path: Path) -> bool:
+    """Whether a .json path is a deployment file (deployment/, .stacksorbit/ or a named manifest)"""
+    return (relative_path.parts[0] in ('deployment', '.stacksorbit')
+            or relative_path.name in ('manifest.json', 'deployments.json'))
+
+
+# Contract name substrings per category; the first category with a match
+# wins, so declaration order matters
+CATEGORIES_GENERIC = MappingProxyType({
+    # Generic Stacks contract patterns (SDK 3.8 compatible)
+    'traits': (
+        'trait', 'traits', 'interfaces', 'interface',
+        'sip-009', 'sip-010', 'sip-013', 'sip-018'
+    ),
+    'tokens': (
+        'token', 'ft', 'nft', 'fungible', 'non-fungible',
+        'mint', 'burn', 'transfer', 'balance', 'supply'
+    ),
+    'defi': (
+        'dex', 'swap', 'pool', 'liquidity', 'amm',
+        'router', 'factory', 'pair', 'vault', 'staking',
+        'farming', 'yield', 'rewards', 'governance'
+    ),
+    'oracle': (
+        'oracle', 'price', 'feed', 'aggregator', 'adapter',
+        'btc', 'usd', 'eth', 'chainlink', 'pyth'
+    ),
+    'dao': (
+        'dao', 'governance', 'proposal', 'vote', 'voting',
+        'timelock', 'upgrade', 'admin', 'owner', 'controller'
+    ),
+    'security': (
+        'auth', 'access', 'control', 'circuit', 'breaker',
+        'pause', 'pausable', 'rate', 'limit', 'emergency'
+    ),
+    'utilities': (
+        'utils', 'util', 'helper', 'library', 'lib',
+        'math', 'string', 'encoding', 'crypto', 'hash'
+    ),
+    'testing': (
+        'test', 'mock', 'fake', 'simulator', 'debug'
+    )
+})
+
+# Extra categories used in Conxian mode, checked after the generic ones
+CATEGORIES_CONXIAN = MappingProxyType({
+    'conxian_base': (
+        'all-traits', 'utils-encoding', 'utils-utils', 'lib-error-codes',
+        'math-lib-advanced', 'fixed-point-math', 'standard-constants'
+    ),
+    'conxian_tokens': (
+        'cxd-token', 'cxlp-token', 'cxvg-token', 'cxtr-token', 'cxs-token',
+        'governance-token', 'token-system-coordinator', 'token-emission-controller'
+    ),
+    'conxian_dex': (
+        'dex-factory', 'dex-factory-v2', 'dex-router', 'dex-pool', 'dex-vault',
+        'dex-multi-hop-router-v3', 'fee-manager', 'liquidity-manager',
+        'stable-swap-pool', 'weighted-swap-pool', 'mev-protector'
+    ),
+    'conxian_dimensional': (
+        'dim-registry', 'dim-metrics', 'dim-graph', 'dim-oracle-automation',
+        'dim-revenue-adapter', 'dim-yield-stake', 'position-nft',
+        'dimensional-core', 'dimensional-advanced-router-dijkstra',
+        'concentrated-liquidity-pool', 'concentrated-liquidity-pool-v2'
+    ),
+    'conxian_governance': (
+        'governance-token', 'proposal-engine', 'timelock-controller',
+        'upgrade-controller', 'emergency-governance', 'governance-signature-verifier'
+    ),
+    'conxian_oracle': (
+        'oracle', 'oracle-aggregator', 'oracle-aggregator-v2', 'btc-adapter',
+        'external-oracle-adapter', 'oracle-dimensional-oracle'
+    ),
+    'conxian_security': (
+        'circuit-breaker', 'pausable', 'access-control-interface',
+        'rate-limiter', 'mev-protector', 'monitoring-dashboard'
+    ),
+    'conxian_monitoring': (
+        'analytics-aggregator', 'monitoring-dashboard', 'finance-metrics',
+        'performance-optimizer', 'price-stability-monitor', 'system-monitor',
+        'real-time-monitoring-dashboard', 'protocol-invariant-monitor'
+    ),
+    'conxian_chainhooks': (
+        'batch-processor', 'keeper-coordinator', 'automation-batch-processor',
+        'transaction-batch-processor', 'predictive-scaling-system'
+    ),
+    'conxian_enterprise': (
+        'enterprise-api', 'enterprise-loan-manager', 'compliance-hooks',
+        'budget-manager', 'enterprise-compliance-hooks'
+    ),
+    'conxian_lending': (
+        'comprehensive-lending-system', 'enterprise-loan-manager',
+        'sbtc-lending-system', 'sbtc-lending-integration',
+        'dimensional-vault', 'sbtc-vault', 'vault', 'liquidation-manager'
+    )
+})
+
+_CATEGORY_SETS = {
+    False: CATEGORIES_GENERIC,
+    True: MappingProxyType({**CATEGORIES_GENERIC, **CATEGORIES_CONXIAN})
+}
+
+# Generic dependency order for Stacks contracts; a contract sorts by the
+# earliest entry contained in its name
+PRIORITY_ORDER = (
+    # 1. Traits and interfaces (must come first)
+    'trait', 'traits', 'interface', 'interfaces',
+    'sip-009', 'sip-010', 'sip-013', 'sip-018',
+
+    # 2. Utilities and libraries
+    'utils', 'util', 'helper', 'library', 'lib',
+    'math', 'string', 'encoding', 'crypto', 'hash',
+    'error', 'constants', 'types',
+
+    # 3. Core protocol contracts
+    'core', 'main', 'principal', 'registry', 'manager',
+
+    # 4. Token contracts
+    'token', 'ft', 'nft', 'fungible', 'non-fungible',
+    'mint', 'burn', 'transfer', 'balance', 'supply',
+
+    # 5. DeFi contracts
+    'dex', 'swap', 'pool', 'liquidity', 'amm', 'router', 'factory',
+    'pair', 'vault', 'staking', 'farming', 'yield', 'rewards',
+
+    # 6. Oracle contracts
+    'oracle', 'price', 'feed', 'aggregator', 'adapter',
+
+    # 7. Governance contracts
+    'dao', 'governance', 'proposal', 'vote', 'voting',
+    'timelock', 'upgrade', 'admin', 'owner', 'controller',
+
+    # 8. Security and monitoring
+    'auth', 'access', 'control', 'circuit', 'breaker',
+    'pause', 'pausable', 'rate', 'limit', 'emergency',
+    'monitor', 'analytics', 'metrics', 'dashboard',
+
+    # 9. Testing and development
+    'test', 'mock', 'fake', 'simulator', 'debug'
+)
+
+# First position of each priority substring (built in reverse so the earliest wins)
+PRIORITY_INDEX = {pattern: index for index, pattern in reversed(tuple(enumerate(PRIORITY_ORDER)))}
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_automaton(conxian_mode: bool):
+    """Index category and priority substrings in one automaton, if available"""
+    if not HAS_AHOCORASICK:
+        return None
+
+    # pattern -> (first category rank, first priority index); a missing
+    # side ranks after every real entry so min() ignores it
+    categories = _CATEGORY_SETS[conxian_mode]
+    unranked_category = len(categories)
+    unranked_priority = len(PRIORITY_ORDER)
+    ranks = {}
+    for rank, patterns in enumerate(categories.values()):
+        for pattern in patterns:
+            ranks.setdefault(pattern, [rank, unranked_priority])
+    for pattern, index in PRIORITY_INDEX.items():
+        ranks.setdefault(pattern, [unranked_category, index])[1] = index
+
+    automaton = ahocorasick.Automaton()
+    for pattern, (rank, index) in ranks.items():
+        automaton.add_word(pattern, (rank, index))
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=4096)
+def _contract_category(contract_name: str, conxian_mode: bool) -> str:
+    """Category of a contract name; names repeat across detection paths"""
+    categories = _CATEGORY_SETS[conxian_mode]
+    name_lower = contract_name.lower()
+
+    automaton = _pattern_automaton(conxian_mode)
+    if automaton is not None:
+        category_names = tuple(categories)
+        rank = min((rank for _, (rank, _) in automaton.iter(name_lower)),
+                   default=len(category_names))
+        return category_names[rank] if rank < len(category_names) else 'general'
+
+    # Check against generic categories
+    category_re, ranks = _category_regex(conxian_mode)
+    rank = min((ranks[match.group(1)] for match in category_re.finditer(name_lower)), default=None)
+    if rank is not None:
+        return tuple(categories)[rank]
+
+    # Default category
+    return 'general'
+
+
+@functools.lru_cache(maxsize=4096)
+def _contract_priority(contract_name: str) -> int:
+    """Index of the earliest PRIORITY_ORDER entry contained in a contract name"""
+    name_lower = contract_name.lower()
+
+    # Priority indices do not depend on the category set, so either automaton works
+    automaton = _pattern_automaton(False)
+    if automaton is not None:
+        return min((index for _, (_, index) in automaton.iter(name_lower)),
+                   default=len(PRIORITY_ORDER))
+    return min((PRIORITY_INDEX[match.group(1)] for match in _PRIORITY_RE.finditer(name_lower)),
+               default=len(PRIORITY_ORDER))  # Low priority for unknown contracts
+
+
+@functools.lru_cache(maxsize=16)
+def _priority_order(contract_names: Tuple[str, ...]) -> Tuple[int, ...]:
+    """Stable deployment order of a name sequence, as indices into it"""
+    # Priorities are computed once into a parallel column and the index
+    # permutation is sorted on it, so sorted() never calls back into Python
+    priorities = [_contract_priority(name) for name in contract_names]
+    return tuple(sorted(range(len(contract_names)), key=priorities.__getitem__))
+
+
+@functools.lru_cache(maxsize=None)
+def _category_regex(conxian_mode: bool) -> Tuple['re.Pattern', Dict[str, int]]:
+    """One alternation over every category pattern plus each pattern's first category rank"""
+    ranks = {}
+    for rank, patterns in enumerate(_CATEGORY_SETS[conxian_mode].values()):
+        for pattern in patterns:
+            ranks.setdefault(pattern, rank)
+    return _overlapping_alternation(ranks), ranks
+
+
+def _overlapping_alternation(patterns) -> 're.Pattern':
+    """Regex reporting, at every position, the first listed pattern starting there"""
+    return re.compile('(?=(%s))' % '|'.join(map(re.escape, patterns)))
+
+
+# Priority lookups take the smallest PRIORITY_INDEX among all matches
+_PRIORITY_RE = _overlapping_alternation(dict.fromkeys(PRIORITY_ORDER))
+
+
+def _load_toml(path: Path) -> Optional[Dict]:
+    """Parse a TOML file, or return None when no TOML parser is installed
+
+    Results are cached per (path, mtime), so analysis and contract detection
+    share one parse of Clarinet.toml. Callers must not mutate the result.
+    """
+    return _parse_toml_file(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_toml_file(path: str, mtime_ns: int) -> Optional[Dict]:
+    """Uncached TOML parse behind _load_toml"""
+    if tomllib is not None:
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    if toml is not None:
+        with open(path, 'r') as f:
+            return toml.load(f)
+    return None
+
+
+def _json_loads(data: bytes):
+    """Decode a JSON document from raw file bytes"""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _iter_successful_contracts(manifest_file: Path) -> Iterator[Dict]:
+    """Yield deployment.successful[*] records from a manifest without loading the rest"""
+    with open(manifest_file, 'rb') as f:
+        if HAS_IJSON:
+            import ijson
+
+            yield from ijson.items(f, 'deployment.successful.item')
+            return
+
+        data = _json_loads(f.read())
+    if 'deployment' in data and 'successful' in data['deployment']:
+        yield from data['deployment']['successful']
+
+
+def _read_json_file(path: Path):
+    """Decode a whole JSON file"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _read_json_cached(path: Path):
+    """Decode a JSON file, reusing the previous parse while its mtime is unchanged
+
+    The result is shared between callers; copy it before handing it out.
+    """
+    return _parse_json_file(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_json_file(path: str, mtime_ns: int):
+    """Uncached JSON parse behind _read_json_cached"""
+    return _read_json_file(Path(path))
+
+
+def _read_concurrently(read, paths: List[Path]) -> Iterator[Tuple[Path, object, Optional[Exception]]]:
+    """Apply read to each path on a small thread pool, yielding (path, result, error) in order"""
+    def attempt(path):
+        try:
+            return path, read(path), None
+        except Exception as e:
+            return path, None, e
+
+    if len(paths) < 2:
+        yield from map(attempt, paths)
+        return
+    with ThreadPoolExecutor(max_workers=MANIFEST_READ_WORKERS) as executor:
+        yield from executor.map(attempt, paths)
+
+
+def _get_http_session() -> 'requests.Session':
+    """Get the calling thread's keep-alive HTTP session, creating it on first use"""
+    session = getattr(_thread_sessions, 'session', None)
+    if session is None:
+        # Deferred so detection without a wallet check never imports requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = _thread_sessions.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    return session
+
+
+def _fetch_account_balances(api_url: str, address: str) -> Optional[Dict]:
+    """Balance, available and locked STX for an address, or None if the API has no account"""
+    response = _get_http_session().get(f"{api_url}/v2/accounts/{address}", timeout=HTTP_TIMEOUT)
+    if response.status_code != 200:
+        return None
+
+    data = _json_loads(response.content)
+
+    # /v2/accounts reports amounts as 0x-prefixed hex microSTX
+    balance_stx = parse_micro_stx(data.get('balance', 0)) / MICRO_STX
+    locked_stx = parse_micro_stx(data.get('locked', 0)) / MICRO_STX
+    return {
+        'balance_stx': balance_stx,
+        'available_stx': balance_stx - locked_stx,
+        'locked_stx': locked_stx
+    }
+
+
+def _json_dumps_compact(obj) -> bytes:
+    """Encode obj as compact UTF-8 JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_dumps_line(obj) -> bytes:
+    """Encode obj as one compact newline-terminated JSON line"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def _json_dumps_pretty(obj) -> bytes:
+    """Encode obj as indented UTF-8 JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
 class GenericStacksAutoDetector:
     """Generic Stacks contract auto-detector compatible with Clarinet SDK 3.8"""
 
-    def __init__(self, project_root: Optional[Path] = None, use_conxian_mode: bool = False):
+    def __init__(self, project_root: Optional[Path] = None, use_conxian_mode: bool = False,
+                 quiet: bool = False):
         self.project_root = project_root or Path.cwd()
         self.use_conxian_mode = use_conxian_mode  # Keep Conxian-specific features as optional
+        self.quiet = quiet  # Suppress progress output for library and CI callers
         self.contract_cache = {}
         self.deployment_cache = {}
+        self._config_cache: Dict[Path, Tuple[float, Dict[str, str]]] = {}
+        self._config_paths: Dict[Path, Path] = {}
+        self._skip_cache: Optional[Tuple[Dict, Dict, FrozenSet[str]]] = None
         self.state_file = self.project_root / ".stacksorbit" / "auto_detection_state.json"
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        # Changes since the last snapshot are appended here and replayed on load
+        self.state_log = self.state_file.with_suffix('.jsonl')
+        self._state_log_entries = 0
+        self._pending_hash_updates = {}
+        self._pending_cache_updates = {}
         self.state = self._load_state()
 
         # Load contract categories (generic + optional Conxian)
         self.contract_categories = self._load_contract_categories()
 
-    def _load_contract_categories(self) -> Dict:
-        """Load contract categories - generic Stacks + optional Conxian"""
-        categories = {
-            # Generic Stacks contract patterns (SDK 3.8 compatible)
-            'traits': [
-                'trait', 'traits', 'interfaces', 'interface',
-                'sip-009', 'sip-010', 'sip-013', 'sip-018'
-            ],
-            'tokens': [
-                'token', 'ft', 'nft', 'fungible', 'non-fungible',
-                'mint', 'burn', 'transfer', 'balance', 'supply'
-            ],
-            'defi': [
-                'dex', 'swap', 'pool', 'liquidity', 'amm',
-                'router', 'factory', 'pair', 'vault', 'staking',
-                'farming', 'yield', 'rewards', 'governance'
-            ],
-            'oracle': [
-                'oracle', 'price', 'feed', 'aggregator', 'adapter',
-                'btc', 'usd', 'eth', 'chainlink', 'pyth'
-            ],
-            'dao': [
-                'dao', 'governance', 'proposal', 'vote', 'voting',
-                'timelock', 'upgrade', 'admin', 'owner', 'controller'
-            ],
-            'security': [
-                'auth', 'access', 'control', 'circuit', 'breaker',
-                'pause', 'pausable', 'rate', 'limit', 'emergency'
-            ],
-            'utilities': [
-                'utils', 'util', 'helper', 'library', 'lib',
-                'math', 'string', 'encoding', 'crypto', 'hash'
-            ],
-            'testing': [
-                'test', 'mock', 'fake', 'simulator', 'debug'
-            ]
-        }
+    def _log(self, message: str = ""):
+        """Print a progress line unless the detector is quiet"""
+        if not self.quiet:
+            print(message)
 
-        # Add Conxian-specific categories if in Conxian mode
-        if self.use_conxian_mode:
-            categories.update({
-                'conxian_base': [
-                    'all-traits', 'utils-encoding', 'utils-utils', 'lib-error-codes',
-                    'math-lib-advanced', 'fixed-point-math', 'standard-constants'
-                ],
-                'conxian_tokens': [
-                    'cxd-token', 'cxlp-token', 'cxvg-token', 'cxtr-token', 'cxs-token',
-                    'governance-token', 'token-system-coordinator', 'token-emission-controller'
-                ],
-                'conxian_dex': [
-                    'dex-factory', 'dex-factory-v2', 'dex-router', 'dex-pool', 'dex-vault',
-                    'dex-multi-hop-router-v3', 'fee-manager', 'liquidity-manager',
-                    'stable-swap-pool', 'weighted-swap-pool', 'mev-protector'
-                ],
-                'conxian_dimensional': [
-                    'dim-registry', 'dim-metrics', 'dim-graph', 'dim-oracle-automation',
-                    'dim-revenue-adapter', 'dim-yield-stake', 'position-nft',
-                    'dimensional-core', 'dimensional-advanced-router-dijkstra',
-                    'concentrated-liquidity-pool', 'concentrated-liquidity-pool-v2'
-                ],
-                'conxian_governance': [
-                    'governance-token', 'proposal-engine', 'timelock-controller',
-                    'upgrade-controller', 'emergency-governance', 'governance-signature-verifier'
-                ],
-                'conxian_oracle': [
-                    'oracle', 'oracle-aggregator', 'oracle-aggregator-v2', 'btc-adapter',
-                    'external-oracle-adapter', 'oracle-dimensional-oracle'
-                ],
-                'conxian_security': [
-                    'circuit-breaker', 'pausable', 'access-control-interface',
-                    'rate-limiter', 'mev-protector', 'monitoring-dashboard'
-                ],
-                'conxian_monitoring': [
-                    'analytics-aggregator', 'monitoring-dashboard', 'finance-metrics',
-                    'performance-optimizer', 'price-stability-monitor', 'system-monitor',
-                    'real-time-monitoring-dashboard', 'protocol-invariant-monitor'
-                ],
-                'conxian_chainhooks': [
-                    'batch-processor', 'keeper-coordinator', 'automation-batch-processor',
-                    'transaction-batch-processor', 'predictive-scaling-system'
-                ],
-                'conxian_enterprise': [
-                    'enterprise-api', 'enterprise-loan-manager', 'compliance-hooks',
-                    'budget-manager', 'enterprise-compliance-hooks'
-                ],
-                'conxian_lending': [
-                    'comprehensive-lending-system', 'enterprise-loan-manager',
-                    'sbtc-lending-system', 'sbtc-lending-integration',
-                    'dimensional-vault', 'sbtc-vault', 'vault', 'liquidation-manager'
-                ]
-            })
-
-        return categories
+    def _load_contract_categories(self) -> Mapping[str, Tuple[str, ...]]:
+        """Load contract categories - generic Stacks + optional Conxian"""
+        return _CATEGORY_SETS[self.use_conxian_mode]
 
     def _load_state(self) -> Dict:
         """Load auto-detection state"""
+        state = None
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    return json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    state = _json_loads(f.read())
             except Exception as e:
-                print(f"⚠️  Error loading state: {e}")
+                self._log(f"⚠️  Error loading state: {e}")
+
+        if state is None:
+            state = {
+                'current_directory': str(self.project_root),
+                'last_scan': None,
+                'contract_hashes': {},
+                'deployment_status': {},
+                'directory_history': [],
+                'clarinet_version': self._get_clarinet_version(),
+                'sdk_compatibility': '3.8'
+            }
 
-        return {
-            'current_directory': str(self.project_root),
-            'last_scan': None,
-            'contract_hashes': {},
-            'deployment_status': {},
-            'directory_history': [],
-            'clarinet_version': self._get_clarinet_version(),
-            'sdk_compatibility': '3.8'
-        }
+        self._state_log_entries = self._replay_state_log(state)
+        return state
+
+    def _replay_state_log(self, state: Dict) -> int:
+        """Apply logged changes on top of the snapshot; returns entries applied"""
+        if not self.state_log.exists():
+            return 0
+
+        applied = 0
+        good_offset = 0
+        torn = False
+        try:
+            with open(self.state_log, 'rb') as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b'\n'):
+                            raise ValueError("unterminated entry")
+                        entry = _json_loads(line)
+                    except ValueError:
+                        torn = True  # Torn final line from an interrupted append
+                        break
+                    good_offset += len(line)
+
+                    if entry.get('op') == 'hash_upd':
+                        state.setdefault('contract_hashes', {})[entry['path']] = {
+                            'mtime': entry['mtime'], 'size': entry['size'], 'hash': entry['hash']
+                        }
+                    elif entry.get('op') == 'cache_upd':
+                        state.setdefault('contract_cache', {})[entry['directory']] = entry['entry']
+                    elif entry.get('op') == 'state':
+                        state.update(entry['fields'])
+                    applied += 1
+
+            # Cut the torn tail off so later appends are not stranded behind it
+            if torn:
+                with open(self.state_log, 'r+b') as f:
+                    f.truncate(good_offset)
+                logger.warning("⚠️  Dropped a torn entry from %s", self.state_log)
+        except Exception as e:
+            self._log(f"⚠️  Error replaying state log: {e}")
+
+        return applied
 
     def _get_clarinet_version(self) -> str:
         """Get Clarinet version for SDK compatibility"""
         try:
-            import subprocess
             result = subprocess.run(['clarinet', '--version'],
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
@@ -155,7 +626,7 @@ class GenericStacksAutoDetector:
 
     def detect_and_analyze(self) -> Dict:
         """Complete generic auto-detection and analysis"""
-        print("🔍 StacksOrbit Generic Auto-Detection Starting...\n")
+        self._log("🔍 StacksOrbit Generic Auto-Detection Starting...\n")
 
         # Step 1: Detect current directory and contracts
         detection_result = self._detect_current_setup()
@@ -163,13 +634,13 @@ class GenericStacksAutoDetector:
         # Step 2: Check wallet balance if configuration is available
         wallet_status = self._check_wallet_balance()
         if wallet_status['has_balance']:
-            print(f"💰 Wallet Balance: {wallet_status['balance_stx']:.6f} STX")
+            self._log(f"💰 Wallet Balance: {wallet_status['balance_stx']:.6f} STX")
             if wallet_status['available_stx'] < wallet_status['recommended_minimum']:
-                print(f"   ⚠️  WARNING: Low balance - add STX before deployment")
+                self._log(f"   ⚠️  WARNING: Low balance - add STX before deployment")
             else:
-                print(f"   ✅ Sufficient balance for deployment")
+                self._log(f"   ✅ Sufficient balance for deployment")
         else:
-            print(f"💰 Wallet: Not configured or no balance info available")
+            self._log(f"💰 Wallet: Not configured or no balance info available")
 
         # Step 3: Analyze deployment status
         deployment_analysis = self._analyze_deployment_status()
@@ -192,11 +663,11 @@ class GenericStacksAutoDetector:
     def _detect_current_setup(self) -> Dict:
         """Detect current directory setup and contracts (generic)"""
         current_dir = Path.cwd()
-        print(f"📂 Current directory: {current_dir}")
+        self._log(f"📂 Current directory: {current_dir}")
 
         # Check if directory changed
         if str(current_dir) != self.state.get('current_directory'):
-            print(f"📍 Directory change detected: {self.state.get('current_directory')} → {current_dir}")
+            self._log(f"📍 Directory change detected: {self.state.get('current_directory')} → {current_dir}")
             self.state['current_directory'] = str(current_dir)
             self.state['directory_history'].append({
                 'from': self.state.get('previous_directory'),
@@ -235,47 +706,76 @@ class GenericStacksAutoDetector:
         if cache_key in self.contract_cache:
             return self.contract_cache[cache_key]
 
+        # Reuse the last run's result while the tree looks untouched; results
+        # are persisted per mode since Conxian mode categorizes differently
+        persisted_key = f"{'conxian' if self.use_conxian_mode else 'generic'}|{directory}"
+        signature = self._detection_signature(directory)
+        persisted = self.state.get('contract_cache', {}).get(persisted_key)
+        if persisted and persisted['signature'] == signature and self._contracts_unchanged(persisted['contracts']):
+            contracts = persisted['contracts']
+            self._log(f"♻️  Using cached detection: {len(contracts)} contracts")
+            self.contract_cache[cache_key] = contracts
+            return contracts
+
         contracts = []
 
         # Method 1: Enhanced Clarinet.toml parsing (SDK 3.8 compatible)
         clarinet_contracts = self._parse_generic_clarinet_toml(directory)
         if clarinet_contracts:
             contracts.extend(clarinet_contracts)
-            print(f"✅ Clarinet.toml detection: {len(clarinet_contracts)} contracts")
+            self._log(f"✅ Clarinet.toml detection: {len(clarinet_contracts)} contracts")
 
-        # Method 2: Generic directory scanning (any .clar files)
+        # Method 2: Generic directory scanning (any .clar files, which also
+        # covers the standard project structures)
         directory_contracts = self._generic_directory_scan(directory)
         if directory_contracts:
             # Avoid duplicates
             existing_names = {c['name'] for c in contracts}
             new_contracts = [c for c in directory_contracts if c['name'] not in existing_names]
             contracts.extend(new_contracts)
-            print(f"✅ Directory scanning: {len(new_contracts)} additional contracts")
+            self._log(f"✅ Directory scanning: {len(new_contracts)} additional contracts")
 
         # Method 3: Check for deployment manifests
         manifest_contracts = self._parse_deployment_manifests(directory)
         if manifest_contracts:
-            print(f"📦 Found deployment manifests: {len(manifest_contracts)} contracts referenced")
-
-        # Method 4: Check for standard Stacks project structures
-        project_contracts = self._scan_project_structures(directory)
-        if project_contracts:
-            existing_names = {c['name'] for c in contracts}
-            new_contracts = [c for c in project_contracts if c['name'] not in existing_names]
-            contracts.extend(new_contracts)
-            print(f"✅ Project structure scanning: {len(new_contracts)} additional contracts")
-
-        # Categorize contracts generically
-        contracts = self._categorize_contracts(contracts)
+            self._log(f"📦 Found deployment manifests: {len(manifest_contracts)} contracts referenced")
 
         # Sort by generic dependency order
         contracts = self._sort_contracts_by_generic_dependencies(contracts)
 
         # Cache results
         self.contract_cache[cache_key] = contracts
+        cache_entry = {'signature': signature, 'contracts': contracts}
+        self.state.setdefault('contract_cache', {})[persisted_key] = cache_entry
+        self._pending_cache_updates[persisted_key] = cache_entry
 
         return contracts
 
+    def _detection_signature(self, directory: Path) -> Dict[str, int]:
+        """mtimes of Clarinet.toml and of every directory the contract walk visits
+
+        Adding, removing or renaming a file bumps its parent directory's mtime,
+        so a new .clar anywhere in the tree invalidates the cached result.
+        """
+        # The detector's own state directory changes on every save
+        signature = _dir_mtimes(directory, SKIP_DIRS | {self.state_file.parent.name})
+        try:
+            signature['Clarinet.toml'] = (directory / "Clarinet.toml").stat().st_mtime_ns
+        except OSError:
+            signature['Clarinet.toml'] = 0
+        return signature
+
+    def _contracts_unchanged(self, contracts: List[Dict]) -> bool:
+        """Whether every file behind a cached result still has its recorded size and mtime"""
+        for contract in contracts:
+            try:
+                st = os.stat(contract['full_path'])
+            except (KeyError, OSError):
+                return False
+            if st.st_size != contract.get('size') or st.st_mtime != contract.get('modified'):
+                return False
+        return True
+
     def _parse_generic_clarinet_toml(self, directory: Path) -> List[Dict]:
         """Parse Clarinet.toml in a generic way compatible with SDK 3.8"""
         contracts = []
@@ -286,19 +786,10 @@ class GenericStacksAutoDetector:
 
         try:
             # Try to parse as TOML first
-            try:
-                import tomllib
-                with open(clarinet_path, 'rb') as f:
-                    toml_data = tomllib.load(f)
-            except ImportError:
-                # Fallback for older Python versions
-                try:
-                    import toml
-                    with open(clarinet_path, 'r') as f:
-                        toml_data = toml.load(f)
-                except ImportError:
-                    # Manual parsing fallback
-                    return self._parse_clarinet_toml_manually(clarinet_path)
+            toml_data = _load_toml(clarinet_path)
+            if toml_data is None:
+                # Manual parsing fallback
+                return self._parse_clarinet_toml_manually(clarinet_path)
 
             # Extract contracts from TOML structure
             if 'contracts' in toml_data:
@@ -314,14 +805,12 @@ class GenericStacksAutoDetector:
                                 'full_path': str(full_path),
                                 'source': 'clarinet_toml',
                                 'config': contract_config,
-                                'size': full_path.stat().st_size,
-                                'modified': full_path.stat().st_mtime,
-                                'hash': self._calculate_file_hash(full_path),
+                                **self._file_fingerprint(full_path),
                                 'category': self._determine_contract_category(contract_name)
                             })
 
         except Exception as e:
-            print(f"⚠️  Error parsing Clarinet.toml: {e}")
+            self._log(f"⚠️  Error parsing Clarinet.toml: {e}")
             # Fallback to manual parsing
             return self._parse_clarinet_toml_manually(clarinet_path)
 
@@ -332,210 +821,124 @@ class GenericStacksAutoDetector:
         contracts = []
 
         try:
+            # One pass over the lines: remember the current [table] header and
+            # pick up `path = "..."` under [contracts.NAME]; bare
+            # `name = "file.clar"` pairs are only used if no table declared one
+            section_entries = []
+            simple_entries = []
+            section = None
             with open(clarinet_path, 'r') as f:
-                content = f.read()
-
-            # Enhanced regex patterns for different Clarinet.toml formats
-            patterns = [
-                # SDK 3.8+ format: [contracts.name]
-                r'\[contracts\.([^\]]+)\]\s+path\s*=\s*["\']([^"\']+)["\']',
-                # Alternative format with dependencies
-                r'\[contracts\.([^\]]+)\]\s+path\s*=\s*["\']([^"\']+)["\'].*?depends_on\s*=\s*\[(.*?)\]',
-                # Simple format
-                r'([^\[]+)\s*=\s*["\']([^"\']+\.clar)["\']'
-            ]
-
-            for pattern in patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-                if matches:
-                    for match in matches:
-                        if len(match) >= 2:
-                            contract_name = match[0]
-                            contract_path = match[1]
-
-                            full_path = clarinet_path.parent / contract_path
-                            if full_path.exists():
-                                contracts.append({
-                                    'name': contract_name,
-                                    'path': contract_path,
-                                    'full_path': str(full_path),
-                                    'source': 'clarinet_toml',
-                                    'size': full_path.stat().st_size,
-                                    'modified': full_path.stat().st_mtime,
-                                    'hash': self._calculate_file_hash(full_path),
-                                    'category': self._determine_contract_category(contract_name)
-                                })
-                    break  # Use first successful pattern
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    if line.startswith('['):
+                        section = line.strip('[]').strip()
+                        continue
+
+                    key, sep, value = line.partition('=')
+                    if not sep:
+                        continue
+                    key = key.strip()
+                    value = value.split('#', 1)[0].strip().strip('"\'')
+
+                    if section and section.lower().startswith('contracts.') and key == 'path':
+                        section_entries.append((section[len('contracts.'):].strip('"\''), value))
+                    elif value.endswith('.clar'):
+                        simple_entries.append((key, value))
+
+            for contract_name, contract_path in section_entries or simple_entries:
+                full_path = clarinet_path.parent / contract_path
+                if full_path.exists():
+                    contracts.append({
+                        'name': contract_name,
+                        'path': contract_path,
+                        'full_path': str(full_path),
+                        'source': 'clarinet_toml',
+                        **self._file_fingerprint(full_path),
+                        'category': self._determine_contract_category(contract_name)
+                    })
 
         except Exception as e:
-            print(f"⚠️  Manual parsing failed: {e}")
+            self._log(f"⚠️  Manual parsing failed: {e}")
 
         return contracts
 
     def _generic_directory_scan(self, directory: Path) -> List[Dict]:
         """Generic directory scanning for any .clar files"""
-        contracts = []
-
-        # Standard Stacks project structures
-        scan_patterns = [
-            ("contracts/**/*.clar", "contracts directory"),
-            ("clarinet/contracts/**/*.clar", "clarinet contracts"),
-            ("src/**/*.clar", "src directory"),
-            ("**/*.clar", "any .clar files")
+        # Standard Stacks project structures, checked in order against each
+        # file's relative path; anything else is reported as a loose file
+        scan_sources = [
+            (("contracts",), "contracts directory"),
+            (("clarinet", "contracts"), "clarinet contracts"),
+            (("src",), "src directory"),
+            ((), "any .clar files")
         ]
+        found = {description: [] for _, description in scan_sources}
+
+        # One walk over the tree; each file is stat'd and hashed once
+        clar_files = [(Path(entry.path), entry.stat()) for entry in _scan_files(directory, ('.clar',))]
+        self._prefetch_file_hashes(clar_files)
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for clar_file, st in clar_files:
+            relative_path = clar_file.relative_to(directory)
+            parts = relative_path.parts
+            description = next(desc for prefix, desc in scan_sources if parts[:len(prefix)] == prefix)
+
+            contract_name = clar_file.stem
+            if debug:
+                logger.debug("Found %s contract %s at %s", description, contract_name, relative_path)
+            found[description].append({
+                'name': contract_name,
+                'path': str(relative_path),
+                'full_path': str(clar_file),
+                'source': description,
+                **self._file_fingerprint(clar_file, st),
+                'category': self._determine_contract_category(contract_name)
+            })
 
-        for pattern, description in scan_patterns:
-            found_contracts = list(directory.glob(pattern))
-            if found_contracts:
-                print(f"📁 Found contracts in {description}: {len(found_contracts)} files")
-
-                for clar_file in found_contracts:
-                    if clar_file.is_file():
-                        contract_name = clar_file.stem
-                        contracts.append({
-                            'name': contract_name,
-                            'path': str(clar_file.relative_to(directory)),
-                            'full_path': str(clar_file),
-                            'source': description,
-                            'size': clar_file.stat().st_size,
-                            'modified': clar_file.stat().st_mtime,
-                            'hash': self._calculate_file_hash(clar_file),
-                            'category': self._determine_contract_category(contract_name)
-                        })
-
-        return contracts
-
-    def _scan_project_structures(self, directory: Path) -> List[Dict]:
-        """Scan standard Stacks project structures"""
         contracts = []
-
-        # Check for common Stacks project structures
-        structures = [
-            ("clarinet", "Clarinet project structure"),
-            ("contracts", "Standard contracts directory"),
-            ("src/contracts", "Source contracts"),
-            ("packages", "Monorepo packages"),
-            ("tests/contracts", "Test contracts")
-        ]
-
-        for structure_dir, description in structures:
-            structure_path = directory / structure_dir
-            if structure_path.exists():
-                print(f"🏗️  Found {description}: {structure_path}")
-
-                # Look for contracts in this structure
-                for clar_file in structure_path.rglob("*.clar"):
-                    if clar_file.is_file():
-                        contract_name = clar_file.stem
-                        contracts.append({
-                            'name': contract_name,
-                            'path': str(clar_file.relative_to(directory)),
-                            'full_path': str(clar_file),
-                            'source': description,
-                            'size': clar_file.stat().st_size,
-                            'modified': clar_file.stat().st_mtime,
-                            'hash': self._calculate_file_hash(clar_file),
-                            'category': self._determine_contract_category(contract_name)
-                        })
+        for description, found_contracts in found.items():
+            if found_contracts:
+                self._log(f"📁 Found contracts in {description}: {len(found_contracts)} files")
+                contracts.extend(found_contracts)
 
         return contracts
 
     def _determine_contract_category(self, contract_name: str) -> str:
         """Determine contract category generically"""
-        name_lower = contract_name.lower()
-
-        # Check against generic categories
-        for category, patterns in self.contract_categories.items():
-            if any(pattern in name_lower for pattern in patterns):
-                return category
-
-        # Default category
-        return 'general'
+        return _contract_category(contract_name, self.use_conxian_mode)
 
-    def _categorize_contracts(self, contracts: List[Dict]) -> List[Dict]:
-        """Add category information to contracts"""
-        if not contracts:
-            return []
-
-        for contract in contracts:
-            if 'category' not in contract:
-                contract['category'] = self._determine_contract_category(contract['name'])
-        return contracts
     def _parse_deployment_manifests(self, directory: Path) -> List[Dict]:
         """Parse deployment manifests for contract information"""
         manifests = []
 
-        # Check for deployment manifest files
-        manifest_patterns = [
-            "deployment/**/*.json",
-            "**/manifest.json",
-            "**/deployments.json",
-            ".stacksorbit/**/*.json"
+        # Check for deployment manifest files: anything under deployment/ or
+        # .stacksorbit/, plus manifest.json / deployments.json anywhere
+        manifest_files = [
+            Path(entry.path) for entry in _scan_files(directory, ('.json',))
+            if _is_deployment_json(Path(entry.path).relative_to(directory))
         ]
 
-        for pattern in manifest_patterns:
-            for manifest_file in directory.glob(pattern):
-                if manifest_file.is_file():
-                    try:
-                        with open(manifest_file, 'r') as f:
-                            data = json.load(f)
-
-                        # Extract contract information if available
-                        if 'deployment' in data and 'successful' in data['deployment']:
-                            successful_contracts = data['deployment']['successful']
-                            for contract in successful_contracts:
-                                manifests.append({
-                                    'name': contract.get('name', ''),
-                                    'tx_id': contract.get('tx_id', ''),
-                                    'source': 'deployment_manifest',
-                                    'path': str(manifest_file)
-                                })
-
-                    except Exception as e:
-                        print(f"⚠️  Error reading manifest {manifest_file}: {e}")
+        # Extract contract information if available
+        results = _read_concurrently(lambda path: list(_iter_successful_contracts(path)), manifest_files)
+        for manifest_file, successful_contracts, error in results:
+            if error is not None:
+                logger.warning("⚠️  Error reading manifest %s: %s", manifest_file, error)
+                continue
+            for contract in successful_contracts:
+                manifests.append({
+                    'name': contract.get('name', ''),
+                    'tx_id': contract.get('tx_id', ''),
+                    'source': 'deployment_manifest',
+                    'path': str(manifest_file)
+                })
 
         return manifests
 
     def _sort_contracts_by_generic_dependencies(self, contracts: List[Dict]) -> List[Dict]:
         """Sort contracts by generic dependency order (SDK 3.8 compatible)"""
-        # Generic dependency order for Stacks contracts
-        priority_order = [
-            # 1. Traits and interfaces (must come first)
-            'trait', 'traits', 'interface', 'interfaces',
-            'sip-009', 'sip-010', 'sip-013', 'sip-018',
-
-            # 2. Utilities and libraries
-            'utils', 'util', 'helper', 'library', 'lib',
-            'math', 'string', 'encoding', 'crypto', 'hash',
-            'error', 'constants', 'types',
-
-            # 3. Core protocol contracts
-            'core', 'main', 'principal', 'registry', 'manager',
-
-            # 4. Token contracts
-            'token', 'ft', 'nft', 'fungible', 'non-fungible',
-            'mint', 'burn', 'transfer', 'balance', 'supply',
-
-            # 5. DeFi contracts
-            'dex', 'swap', 'pool', 'liquidity', 'amm', 'router', 'factory',
-            'pair', 'vault', 'staking', 'farming', 'yield', 'rewards',
-
-            # 6. Oracle contracts
-            'oracle', 'price', 'feed', 'aggregator', 'adapter',
-
-            # 7. Governance contracts
-            'dao', 'governance', 'proposal', 'vote', 'voting',
-            'timelock', 'upgrade', 'admin', 'owner', 'controller',
-
-            # 8. Security and monitoring
-            'auth', 'access', 'control', 'circuit', 'breaker',
-            'pause', 'pausable', 'rate', 'limit', 'emergency',
-            'monitor', 'analytics', 'metrics', 'dashboard',
-
-            # 9. Testing and development
-            'test', 'mock', 'fake', 'simulator', 'debug'
-        ]
-
         # Filter out None or invalid contracts
         if not contracts:
             return []
@@ -544,17 +947,9 @@ class GenericStacksAutoDetector:
         if not valid_contracts:
             return []
 
-        def get_priority(contract):
-            name = contract.get('name', '')
-            if not name:
-                return len(priority_order)  # Low priority for contracts without names
-            name_lower = name.lower()
-            for i, priority in enumerate(priority_order):
-                if priority in name_lower:
-                    return i
-            return len(priority_order)  # Low priority for unknown contracts
-
-        return sorted(valid_contracts, key=get_priority)
+        # Repeated analyses of an unchanged project reuse the previous order
+        order = _priority_order(tuple(c['name'] for c in valid_contracts))
+        return [valid_contracts[i] for i in order]
 
     def _analyze_clarinet_toml(self, directory: Path) -> Dict:
         """Analyze Clarinet.toml for SDK compatibility"""
@@ -575,18 +970,10 @@ class GenericStacksAutoDetector:
 
         try:
             # Try TOML parsing first
-            try:
-                import tomllib
-                with open(clarinet_path, 'rb') as f:
-                    toml_data = tomllib.load(f)
-            except ImportError:
-                try:
-                    import toml
-                    with open(clarinet_path, 'r') as f:
-                        toml_data = toml.load(f)
-                except ImportError:
-                    # Manual parsing
-                    return self._analyze_clarinet_toml_manually(clarinet_path)
+            toml_data = _load_toml(clarinet_path)
+            if toml_data is None:
+                # Manual parsing
+                return self._analyze_clarinet_toml_manually(clarinet_path)
 
             # Analyze project structure
             if 'project' in toml_data:
@@ -653,11 +1040,57 @@ class GenericStacksAutoDetector:
             analysis['issues'].append(f'Manual analysis error: {e}')
             analysis['compatible'] = False
 
+        return analysis
+
+    def _cached_file_hash(self, file_path: Path, st: os.stat_result) -> Optional[str]:
+        """Hash recorded for file_path if its mtime and size still match st"""
+        cached = self.state.setdefault('contract_hashes', {}).get(str(file_path))
+        if isinstance(cached, dict) and cached.get('mtime') == st.st_mtime and cached.get('size') == st.st_size:
+            return cached['hash']
+        return None
+
+    def _store_file_hash(self, file_path: Path, st: os.stat_result, file_hash: str):
+        """Record a freshly computed hash with the stat it was taken against"""
+        record = {'mtime': st.st_mtime, 'size': st.st_size, 'hash': file_hash}
+        self.state['contract_hashes'][str(file_path)] = record
+        self._pending_hash_updates[str(file_path)] = record
+
+    def _file_fingerprint(self, file_path: Path, st: Optional[os.stat_result] = None) -> Dict:
+        """Size, mtime and content hash of a file, rehashing only when it changed"""
+        if st is None:
+            st = file_path.stat()
+        file_hash = self._cached_file_hash(file_path, st)
+        if file_hash is None:
+            file_hash = self._calculate_file_hash(file_path)
+            self._store_file_hash(file_path, st, file_hash)
+
+        return {'size': st.st_size, 'modified': st.st_mtime, 'hash': file_hash}
+
+    def _prefetch_file_hashes(self, files: List[Tuple[Path, os.stat_result]]):
+        """Hash every changed file concurrently so later fingerprints hit the cache"""
+        stale = [(file_path, st) for file_path, st in files
+                 if self._cached_file_hash(file_path, st) is None]
+
+        # hashlib and xxhash release the GIL while digesting, so threads scale
+        if len(stale) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            digests = list(executor.map(self._calculate_file_hash, [path for path, _ in stale]))
+        for (file_path, st), file_hash in zip(stale, digests):
+            self._store_file_hash(file_path, st, file_hash)
+
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate file hash for change detection"""
         try:
+            hasher = _new_file_hasher()
             with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+                if os.fstat(f.fileno()).st_size > MMAP_HASH_THRESHOLD:
+                    # Hash straight from the page cache without a bytes copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        hasher.update(mapped)
+                else:
+                    hasher.update(f.read())
+            return hasher.hexdigest()
         except:
             return "unknown"
 
@@ -665,30 +1098,23 @@ class GenericStacksAutoDetector:
         """Find deployment artifacts and history"""
         artifacts = []
 
-        # Check for various deployment-related files
-        artifact_patterns = [
-            "deployment/**/*.json",
-            "**/manifest.json",
-            "**/deployments.json",
-            ".stacksorbit/**/*.json",
-            "**/*.deployment"
-        ]
+        # Check for various deployment-related files: the manifest locations
+        # plus any *.deployment file
+        artifact_entries = {
+            Path(entry.path): entry for entry in _scan_files(directory, ('.json', '.deployment'))
+            if entry.name.endswith('.deployment') or _is_deployment_json(Path(entry.path).relative_to(directory))
+        }
 
-        for pattern in artifact_patterns:
-            for artifact_file in directory.glob(pattern):
-                if artifact_file.is_file():
-                    try:
-                        with open(artifact_file, 'r') as f:
-                            data = json.load(f)
-
-                        artifacts.append({
-                            'type': 'deployment_artifact',
-                            'path': str(artifact_file),
-                            'data': data,
-                            'modified': artifact_file.stat().st_mtime
-                        })
-                    except Exception as e:
-                        print(f"⚠️  Error reading artifact {artifact_file}: {e}")
+        for artifact_file, data, error in _read_concurrently(_read_json_file, list(artifact_entries)):
+            if error is not None:
+                logger.warning("⚠️  Error reading artifact %s: %s", artifact_file, error)
+                continue
+            artifacts.append({
+                'type': 'deployment_artifact',
+                'path': str(artifact_file),
+                'data': data,
+                'modified': artifact_entries[artifact_file].stat().st_mtime
+            })
 
         return artifacts
 
@@ -702,43 +1128,44 @@ class GenericStacksAutoDetector:
             'network': None
         }
 
-        # Look for configuration files (including Conxian .env)
-        config_files = ['.env', 'config.env', '.stacksorbit.env']
+        config_path = self._find_config(directory)
+        if config_path is not None:
+            config_status['has_config'] = True
+            config_status['config_file'] = config_path.name
 
-        for config_file in config_files:
-            config_path = directory / config_file
-            if config_path.exists():
-                config_status['has_config'] = True
-                config_status['config_file'] = config_file
+            # Validate configuration
+            is_valid, missing = self._validate_configuration(config_path)
+            config_status['is_valid'] = is_valid
+            config_status['missing_vars'] = missing
 
-                # Validate configuration
-                is_valid, missing = self._validate_configuration(config_path)
-                config_status['is_valid'] = is_valid
-                config_status['missing_vars'] = missing
-
-                # Extract network
-                config_status['network'] = self._extract_network_from_config(config_path)
-                break
+            # Extract network
+            config_status['network'] = self._extract_network_from_config(config_path)
 
         return config_status
 
+    def _find_config(self, directory: Path) -> Optional[Path]:
+        """First configuration file present in a directory, remembered once found"""
+        try:
+            return self._config_paths[directory]
+        except KeyError:
+            pass
+
+        # A miss is not remembered, so a config created later is still found
+        config_path = next((directory / name for name in CONFIG_FILE_NAMES
+                            if (directory / name).is_file()), None)
+        if config_path is not None:
+            self._config_paths[directory] = config_path
+        return config_path
+
     def _validate_configuration(self, config_path: Path) -> Tuple[bool, List[str]]:
         """Validate configuration file"""
         missing = []
-        required_vars = ['DEPLOYER_PRIVKEY', 'SYSTEM_ADDRESS', 'NETWORK']
+        required_vars = ('DEPLOYER_PRIVKEY', 'SYSTEM_ADDRESS', 'NETWORK')
 
         try:
-            with open(config_path, 'r') as f:
-                config_content = {}
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config_content[key.strip()] = value.strip()
+            config_content = self._load_env(config_path)
 
-            for var in required_vars:
-                if var not in config_content or not config_content[var]:
-                    missing.append(var)
+            missing = [var for var in required_vars if not config_content.get(var)]
 
             # Additional validation
             if 'DEPLOYER_PRIVKEY' in config_content:
@@ -757,19 +1184,24 @@ class GenericStacksAutoDetector:
     def _extract_network_from_config(self, config_path: Path) -> Optional[str]:
         """Extract network from configuration"""
         try:
-            with open(config_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('NETWORK='):
-                        network = line.split('=', 1)[1]
-                        return network
-        except:
-            pass
-        return None
+            return self._load_env(config_path).get('NETWORK')
+        except OSError:
+            return None
+
+    def _load_env(self, config_path: Path) -> Dict[str, str]:
+        """Parse a .env file once per modification; callers must not mutate the result"""
+        mtime = config_path.stat().st_mtime
+        cached = self._config_cache.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        config = dict(_ENV_LINE_RE.findall(config_path.read_text()))
+        self._config_cache[config_path] = (mtime, config)
+        return config
 
     def _analyze_deployment_status(self) -> Dict:
         """Analyze current deployment status"""
-        print("📊 Analyzing deployment status...")
+        self._log("📊 Analyzing deployment status...")
 
         # Check local deployment history
         local_status = self._check_local_deployment_status()
@@ -780,54 +1212,53 @@ class GenericStacksAutoDetector:
         # Compare and determine deployment mode
         deployment_mode = self._determine_deployment_mode(local_status, blockchain_status)
 
+        # Skip list is computed once and handed to the deploy-list calculation
+        contracts_to_skip = self._get_contracts_to_skip(local_status, blockchain_status)
+
         return {
             'local_status': local_status,
             'blockchain_status': blockchain_status,
             'deployment_mode': deployment_mode,
-            'contracts_to_skip': self._get_contracts_to_skip(local_status, blockchain_status),
-            'contracts_to_deploy': self._get_contracts_to_deploy(local_status, blockchain_status)
+            'contracts_to_skip': list(contracts_to_skip),
+            'contracts_to_deploy': self._get_contracts_to_deploy(
+                local_status, blockchain_status, skip_set=contracts_to_skip
+            )
         }
 
     def _check_local_deployment_status(self) -> Dict:
         """Check local deployment status from files"""
-        deployment_history = []
-
-        # Check deployment history
-        history_patterns = [
-            "deployment/history.json",
-            ".stacksorbit/deployment_history.json",
-            "**/deployment_history.json"
-        ]
-
-        for pattern in history_patterns:
-            for history_file in self.project_root.glob(pattern):
-                if history_file.is_file():
-                    try:
-                        with open(history_file, 'r') as f:
-                            data = json.load(f)
-                            deployment_history.extend(data)
-                    except Exception as e:
-                        print(f"⚠️  Error reading {history_file}: {e}")
-
-        # Check manifest files
+        history_shards = []
         manifests = []
-        manifest_patterns = [
-            "deployment/manifest.json",
-            ".stacksorbit/manifest.json",
-            "**/testnet-manifest.json",
-            "**/mainnet-manifest.json"
-        ]
 
-        for pattern in manifest_patterns:
-            for manifest_file in self.project_root.glob(pattern):
-                if manifest_file.is_file():
-                    try:
-                        with open(manifest_file, 'r') as f:
-                            data = json.load(f)
-                            manifests.append(data)
-                    except Exception as e:
-                        print(f"⚠️  Error reading {manifest_file}: {e}")
+        # One pruned walk finds both kinds of file instead of a recursive glob
+        # per pattern
+        history_files, manifest_files = [], []
+        for entry in _scan_files(self.project_root, ('.json',)):
+            relative_path = Path(entry.path).relative_to(self.project_root).as_posix()
+            if entry.name in HISTORY_FILE_NAMES or relative_path in HISTORY_FILE_PATHS:
+                history_files.append(Path(entry.path))
+            elif entry.name in MANIFEST_FILE_NAMES or relative_path in MANIFEST_FILE_PATHS:
+                manifest_files.append(Path(entry.path))
+
+        # Both kinds are loaded together on the read pool; unchanged files
+        # come from the parse cache, so what is returned is a private copy
+        history_set = frozenset(history_files)
+        results = _read_concurrently(_read_json_cached, history_files + manifest_files)
+        for json_file, data, error in results:
+            if error is not None:
+                logger.warning("⚠️  Error reading %s: %s", json_file, error)
+            elif json_file in history_set:
+                # Check deployment history; files are concatenated once below
+                if isinstance(data, list):
+                    history_shards.append(copy.deepcopy(data))
+                else:
+                    logger.warning("⚠️  Error reading %s: expected a list of deployments, got %s",
+                                   json_file, type(data).__name__)
+            else:
+                # Check manifest files
+                manifests.append(copy.deepcopy(data))
 
+        deployment_history = list(itertools.chain.from_iterable(history_shards))
         return {
             'has_local_history': len(deployment_history) > 0,
             'deployment_history': deployment_history,
@@ -867,8 +1298,15 @@ class GenericStacksAutoDetector:
         else:
             return 'full'
 
-    def _get_contracts_to_skip(self, local_status: Dict, blockchain_status: Dict) -> List[str]:
-        """Get contracts that should be skipped (already deployed)"""
+    def _get_contracts_to_skip(self, local_status: Dict, blockchain_status: Dict) -> FrozenSet[str]:
+        """Get contracts that should be skipped (already deployed)
+
+        The result is memoized for the status dicts it was computed from.
+        """
+        cached = self._skip_cache
+        if cached is not None and cached[0] is local_status and cached[1] is blockchain_status:
+            return cached[2]
+
         skip_contracts = set()
 
         # Add contracts from blockchain status
@@ -876,22 +1314,30 @@ class GenericStacksAutoDetector:
             skip_contracts.update(blockchain_status['deployed_contracts'])
 
         # Add contracts from local manifests
-        for manifest in local_status.get('manifests', []):
-            successful = manifest.get('deployment', {}).get('successful', [])
-            for contract in successful:
-                skip_contracts.add(contract.get('name'))
-
-        return list(skip_contracts)
-
-    def _get_contracts_to_deploy(self, local_status: Dict, blockchain_status: Dict) -> List[str]:
-        """Get contracts that need to be deployed"""
+        skip_contracts.update(
+            contract.get('name')
+            for manifest in local_status.get('manifests', [])
+            for contract in manifest.get('deployment', {}).get('successful', ())
+        )
+
+        skip_contracts = frozenset(skip_contracts)
+        self._skip_cache = (local_status, blockchain_status, skip_contracts)
+        return skip_contracts
+
+    def _get_contracts_to_deploy(self, local_status: Dict, blockchain_status: Dict,
+                                 skip_set: Optional[AbstractSet[str]] = None) -> List[str]:
+        """Get contracts that need to be deployed
+
+        skip_set may carry an already computed _get_contracts_to_skip result.
+        """
         # Get all available contracts
         all_contracts = self.contract_cache.get(str(self.project_root), [])
         all_contract_names = {c['name'] for c in all_contracts}
 
         # Remove contracts that should be skipped
-        skip_contracts = set(self._get_contracts_to_skip(local_status, blockchain_status))
-        deploy_contracts = all_contract_names - skip_contracts
+        if skip_set is None:
+            skip_set = self._get_contracts_to_skip(local_status, blockchain_status)
+        deploy_contracts = all_contract_names - skip_set
 
         return list(deploy_contracts)
 
@@ -904,7 +1350,8 @@ class GenericStacksAutoDetector:
 
         # Filter contracts based on deployment mode
         if deployment_mode == 'upgrade':
-            filtered_contracts = [c for c in contracts if c['name'] not in contracts_to_skip]
+            skip_set = frozenset(contracts_to_skip)
+            filtered_contracts = [c for c in contracts if c['name'] not in skip_set]
         else:
             filtered_contracts = contracts
 
@@ -929,22 +1376,8 @@ class GenericStacksAutoDetector:
 
     def _estimate_total_gas(self, contracts: List[Dict]) -> float:
         """Estimate total gas for deployment"""
-        total_gas = 0
-        for contract in contracts:
-            # Base gas per contract (generic estimation)
-            base_gas = 1.0
-            # Complexity multipliers based on category
-            category = contract.get('category', 'general')
-            if category in ['defi', 'dao']:
-                base_gas *= 1.8
-            elif category in ['tokens', 'oracle']:
-                base_gas *= 1.3
-            elif category in ['security', 'utilities']:
-                base_gas *= 1.1
-
-            total_gas += base_gas
-
-        return total_gas
+        # Base gas of 1.0 per contract scaled by its category's complexity
+        return sum(_GAS_MULT.get(contract.get('category', 'general'), 1.0) for contract in contracts)
 
     def _estimate_deployment_time(self, contracts: List[Dict]) -> int:
         """Estimate deployment time in minutes"""
@@ -962,12 +1395,55 @@ class GenericStacksAutoDetector:
         """Save auto-detection state"""
         self.state['last_updated'] = time.time()
 
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        # Append only what changed: new hashes and detection results plus
+        # the small top-level fields
+        entries = [
+            {'op': 'hash_upd', 'path': path, **record}
+            for path, record in self._pending_hash_updates.items()
+        ]
+        entries.extend(
+            {'op': 'cache_upd', 'directory': directory, 'entry': entry}
+            for directory, entry in self._pending_cache_updates.items()
+        )
+        entries.append({
+            'op': 'state',
+            'fields': {key: value for key, value in self.state.items()
+                       if key not in ('contract_hashes', 'contract_cache')}
+        })
+
+        if not self.state_file.exists() or self._state_log_entries + len(entries) >= STATE_COMPACT_EVERY:
+            self._compact_state()
+            return
+
+        with open(self.state_log, 'ab') as f:
+            f.write(b''.join(_json_dumps_line(entry) for entry in entries))
+        self._state_log_entries += len(entries)
+        self._pending_hash_updates.clear()
+        self._pending_cache_updates.clear()
+
+    def _compact_state(self):
+        """Rewrite the full snapshot durably and start a fresh change log"""
+        # Indented output is only worth its size when someone is debugging
+        encode = _json_dumps_pretty if logger.isEnabledFor(logging.DEBUG) else _json_dumps_compact
+
+        # Write beside the live file and swap it in so a crash never leaves
+        # a half-written snapshot
+        tmp_file = self.state_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(encode(self.state))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
+
+        if self.state_log.exists():
+            self.state_log.unlink()
+        self._state_log_entries = 0
+        self._pending_hash_updates.clear()
+        self._pending_cache_updates.clear()
 
     def handle_directory_change(self, new_directory: Path) -> Dict:
         """Handle directory change and update detection"""
-        print(f"\n📂 Handling directory change to: {new_directory}")
+        self._log(f"\n📂 Handling directory change to: {new_directory}")
 
         old_dir = self.state.get('current_directory', '')
         self.state['previous_directory'] = old_dir
@@ -976,6 +1452,8 @@ class GenericStacksAutoDetector:
         # Clear caches for new directory
         self.contract_cache.clear()
         self.deployment_cache.clear()
+        self._config_paths.clear()
+        _priority_order.cache_clear()
 
         # Re-run detection in new directory
         result = self.detect_and_analyze()
@@ -1064,59 +1542,27 @@ class GenericStacksAutoDetector:
         wallet_status['network'] = network
 
         try:
-            # Try to get account info using requests (simplified)
-            import requests
-
-            api_urls = {
-                'mainnet': 'https://api.hiro.so',
-                'testnet': 'https://api.testnet.hiro.so',
-                'devnet': 'http://localhost:20443'
-            }
-
-            api_url = api_urls.get(network, api_urls['testnet'])
-
-            response = requests.get(f"{api_url}/v2/accounts/{address}", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-
-                balance_microstx = int(data.get('balance', 0))
-                locked_microstx = int(data.get('locked', 0))
-
-                balance_stx = balance_microstx / 1000000
-                locked_stx = locked_microstx / 1000000
-                available_stx = balance_stx - locked_stx
-
-                wallet_status.update({
-                    'has_balance': True,
-                    'balance_stx': balance_stx,
-                    'available_stx': available_stx,
-                    'locked_stx': locked_stx
-                })
+            # Try to get account info over the shared keep-alive session
+            balances = _fetch_account_balances(_API_URLS.get(network, _API_URLS['testnet']), address)
+            if balances is not None:
+                wallet_status.update(has_balance=True, **balances)
 
         except Exception as e:
-            print(f"⚠️  Could not check wallet balance: {e}")
+            self._log(f"⚠️  Could not check wallet balance: {e}")
 
         return wallet_status
 
     def _extract_address_from_config(self) -> Optional[str]:
         """Extract Stacks address from configuration"""
-        config_files = ['.env', 'config.env', '.stacksorbit.env']
-
-        for config_file in config_files:
-            config_path = self.project_root / config_file
-            if config_path.exists():
-                try:
-                    with open(config_path, 'r') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line.startswith('SYSTEM_ADDRESS='):
-                                address = line.split('=', 1)[1].strip().strip('"')
-                                if address.startswith('S') and len(address) == 41:
-                                    return address
-                except:
-                    continue
+        config_path = self._find_config(self.project_root)
+        if config_path is None:
+            return None
 
-        return None
+        try:
+            match = _ADDRESS_RE.fullmatch(self._load_env(config_path).get('SYSTEM_ADDRESS', ''))
+        except OSError:
+            return None
+        return match.group(1) if match else None
 
 def main():
     """Main auto-detection function"""
@@ -1132,39 +1578,42 @@ def main():
     # Run complete detection and analysis
     analysis = detector.detect_and_analyze()
 
-    # Show results
-    print(f"\n📂 Directory: {analysis['detection']['directory']}")
-    print(f"📦 Contracts found: {analysis['detection']['contracts_found']}")
-    print(f"📊 Deployment mode: {analysis['deployment_plan']['deployment_mode']}")
-    print(f"🚀 Contracts to deploy: {analysis['deployment_plan']['contracts_to_deploy']}")
-    print(f"⏭️  Contracts to skip: {analysis['deployment_plan']['contracts_to_skip']}")
-    print(f"🏷️  Mode: {analysis['mode']}")
+    # Collect the summary and write it in one call
+    lines = []
+    lines.append(f"\n📂 Directory: {analysis['detection']['directory']}")
+    lines.append(f"📦 Contracts found: {analysis['detection']['contracts_found']}")
+    lines.append(f"📊 Deployment mode: {analysis['deployment_plan']['deployment_mode']}")
+    lines.append(f"🚀 Contracts to deploy: {analysis['deployment_plan']['contracts_to_deploy']}")
+    lines.append(f"⏭️  Contracts to skip: {analysis['deployment_plan']['contracts_to_skip']}")
+    lines.append(f"🏷️  Mode: {analysis['mode']}")
 
     # Show SDK compatibility
     sdk_compat = analysis['detection']['sdk_compatibility']
-    print(f"🔧 SDK Compatibility: {sdk_compat}")
+    lines.append(f"🔧 SDK Compatibility: {sdk_compat}")
 
     # Show recommendations
     recommendations = detector.get_deployment_recommendations(analysis)
     if recommendations:
-        print("\n💡 Recommendations:")
+        lines.append("\n💡 Recommendations:")
         for rec in recommendations:
-            print(f"   {rec}")
+            lines.append(f"   {rec}")
 
     # Show deployment plan
     if analysis['deployment_plan']['filtered_contracts']:
-        print("\n📋 Deployment order:")
+        lines.append("\n📋 Deployment order:")
         for i, contract in enumerate(analysis['deployment_plan']['filtered_contracts'][:10], 1):
             category = contract.get('category', 'general')
-            print(f"   {i}. {contract['name']} ({category})")
+            lines.append(f"   {i}. {contract['name']} ({category})")
 
         if len(analysis['deployment_plan']['filtered_contracts']) > 10:
-            print(f"   ... and {len(analysis['deployment_plan']['filtered_contracts']) - 10} more")
+            lines.append(f"   ... and {len(analysis['deployment_plan']['filtered_contracts']) - 10} more")
+
+    lines.append(f"\n⛽ Estimated gas: {analysis['deployment_plan']['estimated_gas']:.1f} STX")
+    lines.append(f"⏰ Estimated time: {analysis['deployment_plan']['estimated_time']} minutes")
 
-    print(f"\n⛽ Estimated gas: {analysis['deployment_plan']['estimated_gas']:.1f} STX")
-    print(f"⏰ Estimated time: {analysis['deployment_plan']['estimated_time']} minutes")
+    lines.append(f"\n✅ Ready: {analysis['ready']}")
 
-    print(f"\n✅ Ready: {analysis['ready']}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0 if analysis['ready'] else 1
 
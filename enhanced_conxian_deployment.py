@@ -47,8 +47,10 @@ class EnhancedConfigManager:
         with open(self.config_path, 'r') as f:
             for line in f:
                 line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
+                if not line or line.startswith('#'):
+                    continue
+                key, sep, value = line.partition('=')
+                if sep:
                     self.config[key.strip()] = value.strip().strip('"')
 
         # Store the config path for the deployer to use
@@ -4,31 +4,279 @@ Conxian Self-Launch Cost Estimation and Planning Tool
 Analyzes the complete system and provides detailed launch cost breakdowns
 """
 
-import json
+import sys
+import logging
 import argparse
+from collections import Counter, defaultdict, deque
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple
 from dataclasses import dataclass
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder; stdlib json is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+MICRO_STX = 1000000  # microSTX per STX
+
+# __slots__ is spelled out because dataclass(slots=True) needs Python 3.10.
+# The STX amounts are derived slots rather than fields, since a field declared
+# with field(init=False) would clash with its slot.
+@dataclass(frozen=True)
 class ContractInfo:
+    __slots__ = ('name', 'path', 'category', 'dependencies', 'estimated_gas', 'complexity', 'launch_phase',
+                 'stx_cost')
+
     name: str
     path: str
     category: str
-    dependencies: List[str]
+    dependencies: Tuple[str, ...]
     estimated_gas: int
     complexity: str
     launch_phase: str
 
-@dataclass
+    def __post_init__(self):
+        object.__setattr__(self, 'stx_cost', self.estimated_gas / MICRO_STX)
+
+@dataclass(frozen=True)
 class LaunchPhase:
+    __slots__ = ('name', 'min_funding', 'max_funding', 'contracts', 'total_gas', 'description',
+                 'min_stx', 'max_stx')
+
     name: str
     min_funding: int
     max_funding: int
-    contracts: List[str]
+    contracts: Tuple[str, ...]
     total_gas: int
     description: str
 
+    def __post_init__(self):
+        object.__setattr__(self, 'min_stx', self.min_funding / MICRO_STX)
+        object.__setattr__(self, 'max_stx', self.max_funding / MICRO_STX)
+
+# Contract and phase tables are static, so they are built once per process and
+# shared read-only by every estimator
+_CONTRACTS: Mapping[str, ContractInfo] = MappingProxyType({
+    # Core System Contracts
+    'all-traits': ContractInfo(
+        name='all-traits',
+        path='contracts/traits/all-traits.clar',
+        category='core',
+        dependencies=(),
+        estimated_gas=2000000,
+        complexity='high',
+        launch_phase='bootstrap'
+    ),
+    'utils-encoding': ContractInfo(
+        name='utils-encoding',
+        path='contracts/utils/encoding.clar',
+        category='core',
+        dependencies=('all-traits',),
+        estimated_gas=1500000,
+        complexity='medium',
+        launch_phase='bootstrap'
+    ),
+    'utils-utils': ContractInfo(
+        name='utils-utils',
+        path='contracts/utils/utils.clar',
+        category='core',
+        dependencies=('all-traits',),
+        estimated_gas=1500000,
+        complexity='medium',
+        launch_phase='bootstrap'
+    ),
+
+    # Token System
+    'cxd-token': ContractInfo(
+        name='cxd-token',
+        path='contracts/tokens/cxd-token.clar',
+        category='tokens',
+        dependencies=('all-traits', 'utils-encoding'),
+        estimated_gas=3000000,
+        complexity='high',
+        launch_phase='core'
+    ),
+    'token-emission-controller': ContractInfo(
+        name='token-emission-controller',
+        path='contracts/dex/token-emission-controller.clar',
+        category='tokens',
+        dependencies=('all-traits', 'cxd-token'),
+        estimated_gas=2500000,
+        complexity='high',
+        launch_phase='core'
+    ),
+
+    # DEX System
+    'dex-factory': ContractInfo(
+        name='dex-factory',
+        path='contracts/dex/dex-factory.clar',
+        category='dex',
+        dependencies=('all-traits', 'utils-encoding'),
+        estimated_gas=4000000,
+        complexity='high',
+        launch_phase='core'
+    ),
+    'dex-router': ContractInfo(
+        name='dex-router',
+        path='contracts/dex/dex-router.clar',
+        category='dex',
+        dependencies=('dex-factory', 'cxd-token'),
+        estimated_gas=5000000,
+        complexity='high',
+        launch_phase='liquidity'
+    ),
+
+    # Oracle System
+    'oracle': ContractInfo(
+        name='oracle',
+        path='contracts/oracle.clar',
+        category='oracle',
+        dependencies=('all-traits',),
+        estimated_gas=2500000,
+        complexity='high',
+        launch_phase='core'
+    ),
+    'oracle-aggregator': ContractInfo(
+        name='oracle-aggregator',
+        path='contracts/oracle/oracle-aggregator.clar',
+        category='oracle',
+        dependencies=('oracle',),
+        estimated_gas=3000000,
+        complexity='high',
+        launch_phase='liquidity'
+    ),
+
+    # Governance System
+    'governance-token': ContractInfo(
+        name='governance-token',
+        path='contracts/governance-token.clar',
+        category='governance',
+        dependencies=('all-traits',),
+        estimated_gas=2000000,
+        complexity='medium',
+        launch_phase='governance'
+    ),
+    'proposal-engine': ContractInfo(
+        name='proposal-engine',
+        path='contracts/proposal-engine.clar',
+        category='governance',
+        dependencies=('governance-token',),
+        estimated_gas=3000000,
+        complexity='high',
+        launch_phase='governance'
+    ),
+
+    # Autonomous Systems
+    'self-launch-coordinator': ContractInfo(
+        name='self-launch-coordinator',
+        path='contracts/self-launch-coordinator.clar',
+        category='autonomous',
+        dependencies=('all-traits', 'token-emission-controller'),
+        estimated_gas=2000000,
+        complexity='high',
+        launch_phase='autonomous'
+    ),
+    'predictive-scaling-system': ContractInfo(
+        name='predictive-scaling-system',
+        path='contracts/dex/predictive-scaling-system.clar',
+        category='autonomous',
+        dependencies=('all-traits',),
+        estimated_gas=2500000,
+        complexity='high',
+        launch_phase='autonomous'
+    ),
+    'automation-keeper-coordinator': ContractInfo(
+        name='automation-keeper-coordinator',
+        path='contracts/automation/keeper-coordinator.clar',
+        category='autonomous',
+        dependencies=('all-traits',),
+        estimated_gas=2000000,
+        complexity='medium',
+        launch_phase='autonomous'
+    )
+})
+
+# Launch phases in funding order
+_PHASES: Mapping[str, LaunchPhase] = MappingProxyType({
+    'bootstrap': LaunchPhase(
+        name='Community Bootstrap',
+        min_funding=100000000,  # 100 STX
+        max_funding=500000000,  # 500 STX
+        contracts=('all-traits', 'utils-encoding', 'utils-utils'),
+        total_gas=2000000,
+        description='Essential infrastructure - deployable by community'
+    ),
+    'micro_core': LaunchPhase(
+        name='Micro Core',
+        min_funding=500000000,  # 500 STX
+        max_funding=1000000000,  # 1K STX
+        contracts=('cxd-price-initializer', 'token-system-coordinator'),
+        total_gas=3000000,
+        description='Core utilities and price management'
+    ),
+    'token_system': LaunchPhase(
+        name='Token System',
+        min_funding=1000000000,  # 1K STX
+        max_funding=2500000000,  # 2.5K STX
+        contracts=('cxd-token', 'token-emission-controller'),
+        total_gas=5000000,
+        description='Basic token functionality and emission control'
+    ),
+    'dex_core': LaunchPhase(
+        name='DEX Core',
+        min_funding=2500000000,  # 2.5K STX
+        max_funding=5000000000,  # 5K STX
+        contracts=('oracle', 'dex-factory', 'budget-manager'),
+        total_gas=10000000,
+        description='DEX infrastructure and basic trading'
+    ),
+    'liquidity': LaunchPhase(
+        name='Liquidity & Trading',
+        min_funding=5000000000,  # 5K STX
+        max_funding=10000000000,  # 10K STX
+        contracts=('dex-router', 'dex-pool', 'oracle-aggregator'),
+        total_gas=15000000,
+        description='Advanced trading and liquidity provision'
+    ),
+    'governance': LaunchPhase(
+        name='Governance',
+        min_funding=10000000000,  # 10K STX
+        max_funding=25000000000,  # 25K STX
+        contracts=('governance-token', 'proposal-engine', 'timelock-controller'),
+        total_gas=8000000,
+        description='Community governance and decision making'
+    ),
+    'autonomous': LaunchPhase(
+        name='Fully Autonomous',
+        min_funding=25000000000,  # 25K STX
+        max_funding=50000000000,  # 50K STX
+        contracts=('self-launch-coordinator', 'predictive-scaling-system', 'automation-keeper-coordinator'),
+        total_gas=5000000,
+        description='Self-sustaining autonomous operation'
+    )
+})
+
+# Single source of truth for phase names, shared with the CLI choices
+_VALID_PHASES = frozenset(_PHASES)
+
+# Roadmap milestones are literal and shared by every estimator; each roadmap
+# gets its own copies so edits never leak into later roadmaps
+_MILESTONES = (
+    {'phase': 'bootstrap', 'funding': '100 STX', 'contracts': 3, 'description': 'Core infrastructure'},
+    {'phase': 'micro_core', 'funding': '500 STX', 'contracts': 2, 'description': 'Price management'},
+    {'phase': 'token_system', 'funding': '1K STX', 'contracts': 2, 'description': 'Token functionality'},
+    {'phase': 'dex_core', 'funding': '2.5K STX', 'contracts': 3, 'description': 'DEX infrastructure'},
+    {'phase': 'liquidity', 'funding': '5K STX', 'contracts': 3, 'description': 'Trading enabled'},
+    {'phase': 'governance', 'funding': '10K STX', 'contracts': 3, 'description': 'Community governance'},
+    {'phase': 'autonomous', 'funding': '25K+ STX', 'contracts': 3, 'description': 'Self-sustaining'},
+)
+
 class LaunchCostEstimator:
     """Comprehensive cost estimation for Conxian self-launch"""
 
@@ -36,251 +284,130 @@ class LaunchCostEstimator:
         self.contracts = self._load_contract_database()
         self.launch_phases = self._define_launch_phases()
         self.gas_price = 1000000  # 1 STX per deployment (conservative)
+        self._total_cost = self._summarize_total_cost()
+        self._deploy_order, self._missing_deps = self._topo_order()
+        self._phase_contracts = self._resolve_phase_contracts()
+        self._phase_cache: Dict[str, Dict] = {}
 
-    def _load_contract_database(self) -> Dict[str, ContractInfo]:
+    def _load_contract_database(self) -> Mapping[str, ContractInfo]:
         """Load comprehensive contract database"""
-        return {
-            # Core System Contracts
-            'all-traits': ContractInfo(
-                name='all-traits',
-                path='contracts/traits/all-traits.clar',
-                category='core',
-                dependencies=[],
-                estimated_gas=2000000,
-                complexity='high',
-                launch_phase='bootstrap'
-            ),
-            'utils-encoding': ContractInfo(
-                name='utils-encoding',
-                path='contracts/utils/encoding.clar',
-                category='core',
-                dependencies=['all-traits'],
-                estimated_gas=1500000,
-                complexity='medium',
-                launch_phase='bootstrap'
-            ),
-            'utils-utils': ContractInfo(
-                name='utils-utils',
-                path='contracts/utils/utils.clar',
-                category='core',
-                dependencies=['all-traits'],
-                estimated_gas=1500000,
-                complexity='medium',
-                launch_phase='bootstrap'
-            ),
-
-            # Token System
-            'cxd-token': ContractInfo(
-                name='cxd-token',
-                path='contracts/tokens/cxd-token.clar',
-                category='tokens',
-                dependencies=['all-traits', 'utils-encoding'],
-                estimated_gas=3000000,
-                complexity='high',
-                launch_phase='core'
-            ),
-            'token-emission-controller': ContractInfo(
-                name='token-emission-controller',
-                path='contracts/dex/token-emission-controller.clar',
-                category='tokens',
-                dependencies=['all-traits', 'cxd-token'],
-                estimated_gas=2500000,
-                complexity='high',
-                launch_phase='core'
-            ),
-
-            # DEX System
-            'dex-factory': ContractInfo(
-                name='dex-factory',
-                path='contracts/dex/dex-factory.clar',
-                category='dex',
-                dependencies=['all-traits', 'utils-encoding'],
-                estimated_gas=4000000,
-                complexity='high',
-                launch_phase='core'
-            ),
-            'dex-router': ContractInfo(
-                name='dex-router',
-                path='contracts/dex/dex-router.clar',
-                category='dex',
-                dependencies=['dex-factory', 'cxd-token'],
-                estimated_gas=5000000,
-                complexity='high',
-                launch_phase='liquidity'
-            ),
-
-            # Oracle System
-            'oracle': ContractInfo(
-                name='oracle',
-                path='contracts/oracle.clar',
-                category='oracle',
-                dependencies=['all-traits'],
-                estimated_gas=2500000,
-                complexity='high',
-                launch_phase='core'
-            ),
-            'oracle-aggregator': ContractInfo(
-                name='oracle-aggregator',
-                path='contracts/oracle/oracle-aggregator.clar',
-                category='oracle',
-                dependencies=['oracle'],
-                estimated_gas=3000000,
-                complexity='high',
-                launch_phase='liquidity'
-            ),
-
-            # Governance System
-            'governance-token': ContractInfo(
-                name='governance-token',
-                path='contracts/governance-token.clar',
-                category='governance',
-                dependencies=['all-traits'],
-                estimated_gas=2000000,
-                complexity='medium',
-                launch_phase='governance'
-            ),
-            'proposal-engine': ContractInfo(
-                name='proposal-engine',
-                path='contracts/proposal-engine.clar',
-                category='governance',
-                dependencies=['governance-token'],
-                estimated_gas=3000000,
-                complexity='high',
-                launch_phase='governance'
-            ),
-
-            # Autonomous Systems
-            'self-launch-coordinator': ContractInfo(
-                name='self-launch-coordinator',
-                path='contracts/self-launch-coordinator.clar',
-                category='autonomous',
-                dependencies=['all-traits', 'token-emission-controller'],
-                estimated_gas=2000000,
-                complexity='high',
-                launch_phase='autonomous'
-            ),
-            'predictive-scaling-system': ContractInfo(
-                name='predictive-scaling-system',
-                path='contracts/dex/predictive-scaling-system.clar',
-                category='autonomous',
-                dependencies=['all-traits'],
-                estimated_gas=2500000,
-                complexity='high',
-                launch_phase='autonomous'
-            ),
-            'automation-keeper-coordinator': ContractInfo(
-                name='automation-keeper-coordinator',
-                path='contracts/automation/keeper-coordinator.clar',
-                category='autonomous',
-                dependencies=['all-traits'],
-                estimated_gas=2000000,
-                complexity='medium',
-                launch_phase='autonomous'
-            )
-        }
+        return _CONTRACTS
 
-    def _define_launch_phases(self) -> Dict[str, LaunchPhase]:
+    def _define_launch_phases(self) -> Mapping[str, LaunchPhase]:
         """Define community-accessible launch phases with micro-contribution support"""
-        return {
-            'bootstrap': LaunchPhase(
-                name='Community Bootstrap',
-                min_funding=100000000,  # 100 STX
-                max_funding=500000000,  # 500 STX
-                contracts=['all-traits', 'utils-encoding', 'utils-utils'],
-                total_gas=2000000,
-                description='Essential infrastructure - deployable by community'
-            ),
-            'micro_core': LaunchPhase(
-                name='Micro Core',
-                min_funding=500000000,  # 500 STX
-                max_funding=1000000000,  # 1K STX
-                contracts=['cxd-price-initializer', 'token-system-coordinator'],
-                total_gas=3000000,
-                description='Core utilities and price management'
-            ),
-            'token_system': LaunchPhase(
-                name='Token System',
-                min_funding=1000000000,  # 1K STX
-                max_funding=2500000000,  # 2.5K STX
-                contracts=['cxd-token', 'token-emission-controller'],
-                total_gas=5000000,
-                description='Basic token functionality and emission control'
-            ),
-            'dex_core': LaunchPhase(
-                name='DEX Core',
-                min_funding=2500000000,  # 2.5K STX
-                max_funding=5000000000,  # 5K STX
-                contracts=['oracle', 'dex-factory', 'budget-manager'],
-                total_gas=10000000,
-                description='DEX infrastructure and basic trading'
-            ),
-            'liquidity': LaunchPhase(
-                name='Liquidity & Trading',
-                min_funding=5000000000,  # 5K STX
-                max_funding=10000000000,  # 10K STX
-                contracts=['dex-router', 'dex-pool', 'oracle-aggregator'],
-                total_gas=15000000,
-                description='Advanced trading and liquidity provision'
-            ),
-            'governance': LaunchPhase(
-                name='Governance',
-                min_funding=10000000000,  # 10K STX
-                max_funding=25000000000,  # 25K STX
-                contracts=['governance-token', 'proposal-engine', 'timelock-controller'],
-                total_gas=8000000,
-                description='Community governance and decision making'
-            ),
-            'autonomous': LaunchPhase(
-                name='Fully Autonomous',
-                min_funding=25000000000,  # 25K STX
-                max_funding=50000000000,  # 50K STX
-                contracts=['self-launch-coordinator', 'predictive-scaling-system', 'automation-keeper-coordinator'],
-                total_gas=5000000,
-                description='Self-sustaining autonomous operation'
-            )
-        }
+        return _PHASES
+
+    def _topo_order(self) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """Order contracts so each one follows its dependencies (Kahn's algorithm)"""
+        indegree: Dict[str, int] = {name: 0 for name in self.contracts}
+        succ: Dict[str, List[str]] = {name: [] for name in self.contracts}
+        missing = set()
+
+        for contract in self.contracts.values():
+            for dep in contract.dependencies:
+                if dep in succ:
+                    succ[dep].append(contract.name)
+                    indegree[contract.name] += 1
+                else:
+                    missing.add(dep)
+
+        queue = deque(name for name, degree in indegree.items() if degree == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for dependent in succ[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(order) != len(indegree):
+            cyclic = sorted(name for name, degree in indegree.items() if degree)
+            raise ValueError(f"Dependency cycle between contracts: {', '.join(cyclic)}")
+
+        return tuple(order), frozenset(missing)
+
+    # Roadmap-only aggregates are built on first use, so phase and total
+    # estimates do not pay for them
+    @cached_property
+    def _cost_breakdown(self) -> Dict[str, List[Dict]]:
+        """Contract costs grouped by category"""
+        categories = defaultdict(list)
+        for contract in self.contracts.values():
+            categories[contract.category].append({
+                'name': contract.name,
+                'gas': contract.estimated_gas,
+                'stx': contract.stx_cost
+            })
+        return dict(categories)
+
+    def _resolve_phase_contracts(self) -> Dict[str, Tuple[ContractInfo, ...]]:
+        """Map each phase to the contract records it names, warning about unknown names"""
+        resolved = {}
+        for name, phase in self.launch_phases.items():
+            unknown = [c for c in phase.contracts if c not in self.contracts]
+            if unknown:
+                logger.warning("Phase %s lists contracts missing from the database: %s", name, ', '.join(unknown))
+            resolved[name] = tuple(self.contracts[c] for c in phase.contracts if c in self.contracts)
+        return resolved
+
+    def get_deploy_order(self) -> Tuple[str, ...]:
+        """Contract names in an order that satisfies every known dependency"""
+        return self._deploy_order
+
+    def get_missing_dependencies(self) -> FrozenSet[str]:
+        """Dependencies referenced by contracts but absent from the database"""
+        return self._missing_deps
 
     def estimate_total_launch_cost(self) -> Dict:
         """Estimate total cost for complete system launch"""
-        total_cost = 0
-        total_gas = 0
+        # Totals are fixed per estimator; hand out a copy of the summary
+        return dict(self._total_cost)
 
-        for phase in self.launch_phases.values():
-            total_cost += phase.max_funding
-            total_gas += phase.total_gas
+    def _summarize_total_cost(self) -> Dict:
+        """Sum funding and gas over every launch phase"""
+        total_cost = sum(phase.max_funding for phase in self.launch_phases.values())
+        total_gas = sum(phase.total_gas for phase in self.launch_phases.values())
 
         return {
             'total_funding_required': total_cost,
             'total_gas_cost': total_gas,
-            'estimated_stx_cost': total_cost / 1000000,
+            'estimated_stx_cost': total_cost / MICRO_STX,
             'total_contracts': len(self.contracts),
             'phases': len(self.launch_phases),
-            'bootstrap_cost': self.launch_phases['bootstrap'].min_funding / 1000000,
-            'full_system_cost': total_cost / 1000000
+            'bootstrap_cost': self.launch_phases['bootstrap'].min_stx,
+            'full_system_cost': total_cost / MICRO_STX
         }
 
     def estimate_phase_cost(self, phase: str) -> Dict:
         """Estimate cost for specific launch phase"""
-        if phase not in self.launch_phases:
+        if phase not in _VALID_PHASES:
             return {'error': 'Phase not found'}
 
+        cached = self._phase_cache.get(phase)
+        if cached is None:
+            cached = self._phase_cache[phase] = self._build_phase_cost(phase)
+        # Hand out a copy, as estimate_total_launch_cost does, so callers
+        # cannot edit the cached rows
+        return {**cached, 'contracts': [dict(row) for row in cached['contracts']]}
+
+    def _build_phase_cost(self, phase: str) -> Dict:
+        """Price every known contract in a launch phase"""
         phase_info = self.launch_phases[phase]
-        contract_costs = []
-
-        for contract_name in phase_info.contracts:
-            if contract_name in self.contracts:
-                contract = self.contracts[contract_name]
-                contract_costs.append({
-                    'name': contract.name,
-                    'gas_cost': contract.estimated_gas,
-                    'stx_cost': contract.estimated_gas / 1000000,
-                    'complexity': contract.complexity
-                })
+        contract_costs = [
+            {
+                'name': contract.name,
+                'gas_cost': contract.estimated_gas,
+                'stx_cost': contract.stx_cost,
+                'complexity': contract.complexity
+            }
+            for contract in self._phase_contracts[phase]
+        ]
 
         return {
             'phase': phase_info.name,
-            'min_funding': phase_info.min_funding / 1000000,
-            'max_funding': phase_info.max_funding / 1000000,
+            'min_funding': phase_info.min_stx,
+            'max_funding': phase_info.max_stx,
             'total_gas': phase_info.total_gas,
             'contract_count': len(contract_costs),
             'contracts': contract_costs,
@@ -301,29 +428,13 @@ class LaunchCostEstimator:
         for phase_name, phase in self.launch_phases.items():
             roadmap['phases'][phase_name] = self.estimate_phase_cost(phase_name)
 
-        # Cost breakdown by category
-        categories = {}
-        for contract in self.contracts.values():
-            if contract.category not in categories:
-                categories[contract.category] = []
-            categories[contract.category].append({
-                'name': contract.name,
-                'gas': contract.estimated_gas,
-                'stx': contract.estimated_gas / 1000000
-            })
-
-        roadmap['cost_breakdown'] = categories
+        # Cost breakdown by category, copied out of the cached grouping
+        roadmap['cost_breakdown'] = {
+            category: [dict(row) for row in rows] for category, rows in self._cost_breakdown.items()
+        }
 
         # Milestones
-        roadmap['milestones'] = [
-            {'phase': 'bootstrap', 'funding': '100 STX', 'contracts': 3, 'description': 'Core infrastructure'},
-            {'phase': 'micro_core', 'funding': '500 STX', 'contracts': 2, 'description': 'Price management'},
-            {'phase': 'token_system', 'funding': '1K STX', 'contracts': 2, 'description': 'Token functionality'},
-            {'phase': 'dex_core', 'funding': '2.5K STX', 'contracts': 3, 'description': 'DEX infrastructure'},
-            {'phase': 'liquidity', 'funding': '5K STX', 'contracts': 3, 'description': 'Trading enabled'},
-            {'phase': 'governance', 'funding': '10K STX', 'contracts': 3, 'description': 'Community governance'},
-            {'phase': 'autonomous', 'funding': '25K+ STX', 'contracts': 3, 'description': 'Self-sustaining'}
-        ]
+        roadmap['milestones'] = [dict(milestone) for milestone in _MILESTONES]
 
         # Risk assessment
         roadmap['risk_assessment'] = {
@@ -339,21 +450,37 @@ class LaunchCostEstimator:
 
     def _calculate_complexity_score(self) -> int:
         """Calculate overall system complexity score"""
-        total_complexity = 0
-        complexity_weights = {'high': 3, 'medium': 2, 'low': 1}
-
-        for contract in self.contracts.values():
-            total_complexity += complexity_weights.get(contract.complexity, 1)
-
-        return total_complexity
+        return self._complexity_score
+
+    @cached_property
+    def _complexity_score(self) -> int:
+        """Weight contracts high=3, medium=2 and anything else 1"""
+        counts = Counter(c.complexity for c in self.contracts.values())
+        return 3 * counts['high'] + 2 * counts['medium'] + (
+            sum(counts.values()) - counts['high'] - counts['medium']
+        )
+
+def _write_json(obj, pretty: bool = False):
+    """Write obj to stdout as compact JSON, or indented when pretty is set"""
+    if HAS_ORJSON:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        sys.stdout.write(orjson.dumps(obj, option=option).decode())
+    else:
+        import json  # only needed without orjson
+        if pretty:
+            json.dump(obj, sys.stdout, indent=2)
+        else:
+            json.dump(obj, sys.stdout, separators=(',', ':'))
+        sys.stdout.write("\n")
 
 def main():
     """Main CLI function for launch cost estimation"""
     parser = argparse.ArgumentParser(description='Conxian Self-Launch Cost Estimation Tool')
-    parser.add_argument('--phase', choices=['bootstrap', 'micro_core', 'token_system', 'dex_core', 'liquidity', 'governance', 'autonomous', 'all'])
+    parser.add_argument('--phase', choices=[*_PHASES, 'all'])
     parser.add_argument('--output-format', choices=['json', 'text'], default='text')
     parser.add_argument('--detailed', action='store_true', help='Show detailed contract breakdown')
     parser.add_argument('--roadmap', action='store_true', help='Generate full launch roadmap')
+    parser.add_argument('--pretty', action='store_true', help='Indent JSON output')
 
     args = parser.parse_args()
 
@@ -363,20 +490,20 @@ def main():
         if args.roadmap:
             roadmap = estimator.generate_launch_roadmap()
             if args.output_format == 'json':
-                print(json.dumps(roadmap, indent=2))
+                _write_json(roadmap, args.pretty)
             else:
                 print_launch_roadmap(roadmap)
         elif args.phase:
             if args.phase == 'all':
                 total_cost = estimator.estimate_total_launch_cost()
                 if args.output_format == 'json':
-                    print(json.dumps(total_cost, indent=2))
+                    _write_json(total_cost, args.pretty)
                 else:
                     print_total_cost_summary(total_cost)
             else:
                 phase_cost = estimator.estimate_phase_cost(args.phase)
                 if args.output_format == 'json':
-                    print(json.dumps(phase_cost, indent=2))
+                    _write_json(phase_cost, args.pretty)
                 else:
                     print_phase_cost_summary(phase_cost, args.detailed)
         else:
@@ -390,6 +517,10 @@ def main():
 
     return 0
 
+# Row layouts for the tabular text reports
+_CONTRACT_ROW = "{name:<30} {gas_cost:<12} {stx_cost:<10.2f} {complexity:<10}"
+_MILESTONE_ROW = "{phase:<15} {funding:<12} {contracts:<10} {description:<30}"
+
 def print_total_cost_summary(cost_data: Dict):
     """Print total launch cost summary"""
     print(f"\n{'='*60}")
@@ -421,9 +552,9 @@ def print_phase_cost_summary(phase_data: Dict, detailed: bool):
         print(f"\nDETAILED CONTRACT BREAKDOWN:")
         print(f"{'Contract':<30} {'Gas Cost':<12} {'STX Cost':<10} {'Complexity':<10}")
         print(f"{'-'*70}")
-        for contract in phase_data['contracts']:
-            stx_formatted = f"{contract['stx']:.2f}"
-            print(f"{contract['name']:<30} {contract['gas_cost']:<12} {stx_formatted:<10} {contract['complexity']:<10}")
+        rows = [_CONTRACT_ROW.format_map(contract) for contract in phase_data['contracts']]
+        if rows:
+            sys.stdout.write("\n".join(rows) + "\n")
 
 def print_launch_roadmap(roadmap: Dict):
     """Print comprehensive launch roadmap"""
@@ -443,8 +574,9 @@ def print_launch_roadmap(roadmap: Dict):
     print(f"\nLAUNCH MILESTONES:")
     print(f"{'Phase':<15} {'Funding':<12} {'Contracts':<10} {'Description':<30}")
     print(f"{'-'*70}")
-    for milestone in roadmap['milestones']:
-        print(f"{milestone['phase']:<15} {milestone['funding']:<12} {milestone['contracts']:<10} {milestone['description']:<30}")
+    rows = [_MILESTONE_ROW.format_map(milestone) for milestone in roadmap['milestones']]
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
 
     # Risk assessment
     risk = roadmap['risk_assessment']
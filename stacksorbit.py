@@ -762,8 +762,8 @@ class GuiDeployer(tk.Tk):
                 line = line.strip()
                 if not line or line.startswith('#'):
                     continue
-                if '=' in line:
-                    k, v = line.split('=', 1)
+                k, sep, v = line.partition('=')
+                if sep:
                     v = v.strip().strip('"')
                     os.environ[k.strip()] = v
                     if k.strip() in ('CORE_API_URL','STACKS_API_BASE') and not self.core_api_url.get().strip():
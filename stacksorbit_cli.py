@@ -8,8 +8,12 @@ import os
 import sys
 import json
 import time
+import shutil
 import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -17,7 +21,6 @@ from datetime import datetime
 from enhanced_conxian_deployment import EnhancedConfigManager, EnhancedConxianDeployer
 from deployment_monitor import DeploymentMonitor
 from deployment_verifier import DeploymentVerifier
-from enhanced_dashboard import EnhancedDashboard
 from local_devnet import LocalDevnet
 
 try:
@@ -28,6 +31,36 @@ try:
 except ImportError:
     USE_COLORS = False
 
+    class _Null:
+        """Stand-in for colorama's Fore/Style that yields empty codes"""
+        def __getattr__(self, name: str) -> str:
+            return ''
+
+    Fore = Style = _Null()
+
+# Contract name keywords per category; the first category with a match wins
+CONTRACT_CATEGORIES = MappingProxyType({
+    'base': ('trait', 'utils', 'lib', 'error', 'constant', 'math'),
+    'tokens': ('token', 'cxd', 'cxlp', 'cxvg', 'cxtr', 'cxs'),
+    'dex': ('dex', 'factory', 'router', 'pool', 'swap'),
+    'dimensional': ('dim', 'dimensional', 'position', 'concentrated'),
+    'oracle': ('oracle', 'aggregator', 'btc'),
+    'governance': ('governance', 'proposal', 'timelock'),
+    'security': ('circuit', 'pausable', 'access', 'security'),
+    'monitoring': ('monitor', 'analytics', 'dashboard')
+})
+
+def _run_tool(args: List[str], timeout: int, **kwargs) -> subprocess.CompletedProcess:
+    """Run an external tool with its output captured
+
+    close_fds=False and an absolute executable path let CPython start the child
+    with posix_spawn instead of fork+exec. Descriptors Python opens are
+    non-inheritable (PEP 446), so nothing extra leaks into the child.
+    """
+    executable = shutil.which(args[0]) or args[0]
+    return subprocess.run([executable, *args[1:]], capture_output=True, timeout=timeout,
+                          close_fds=False, **kwargs)
+
 class SetupWizard:
     """Interactive setup wizard for StacksOrbit"""
 
@@ -83,9 +116,17 @@ class SetupWizard:
 
         all_met = True
 
-        for name, command, expected in prerequisites:
+        # Each probe mostly waits on process startup, so run them side by side
+        # and report in the listed order
+        with ThreadPoolExecutor(max_workers=len(prerequisites)) as pool:
+            probes = [
+                (name, pool.submit(_run_tool, command.split(), 10, text=True))
+                for name, command, expected in prerequisites
+            ]
+
+        for name, probe in probes:
             try:
-                result = subprocess.run(command.split(), capture_output=True, text=True, timeout=10)
+                result = probe.result()
                 if result.returncode == 0:
                     version = result.stdout.strip() or result.stderr.strip()
                     print(f"✅ {name}: {version}")
@@ -338,7 +379,7 @@ class SetupWizard:
             total_tests += 1
             print("⚙️  Testing contract compilation...")
             try:
-                result = subprocess.run(['clarinet', 'check'], capture_output=True, text=True, timeout=30)
+                result = _run_tool(['clarinet', 'check'], 30, text=True)
                 if result.returncode == 0:
                     print("✅ Contract compilation successful")
                     tests_passed += 1
@@ -531,24 +572,10 @@ class SetupWizard:
         """Categorize contract by name"""
         name_lower = contract_name.lower()
 
-        if any(word in name_lower for word in ['trait', 'utils', 'lib', 'error', 'constant', 'math']):
-            return 'base'
-        elif any(word in name_lower for word in ['token', 'cxd', 'cxlp', 'cxvg', 'cxtr', 'cxs']):
-            return 'tokens'
-        elif any(word in name_lower for word in ['dex', 'factory', 'router', 'pool', 'swap']):
-            return 'dex'
-        elif any(word in name_lower for word in ['dim', 'dimensional', 'position', 'concentrated']):
-            return 'dimensional'
-        elif any(word in name_lower for word in ['oracle', 'aggregator', 'btc']):
-            return 'oracle'
-        elif any(word in name_lower for word in ['governance', 'proposal', 'timelock']):
-            return 'governance'
-        elif any(word in name_lower for word in ['circuit', 'pausable', 'access', 'security']):
-            return 'security'
-        elif any(word in name_lower for word in ['monitor', 'analytics', 'dashboard']):
-            return 'monitoring'
-        else:
-            return 'other'
+        for category, keywords in CONTRACT_CATEGORIES.items():
+            if any(word in name_lower for word in keywords):
+                return category
+        return 'other'
 
     def _validate_private_key(self, privkey: str) -> bool:
         """Validate private key format"""
@@ -787,8 +814,8 @@ class UltimateStacksOrbit:
 
         if options.get('dashboard'):
             # Run dashboard
-            dashboard = EnhancedDashboard(config, config.get('NETWORK', 'testnet'))
-            dashboard.start_dashboard()
+            from stacksorbit_dashboard import StacksOrbitDashboard
+            StacksOrbitDashboard(config=config, network=config.get('NETWORK', 'testnet')).run()
             return 0
 
         else:
@@ -883,9 +910,9 @@ class UltimateStacksOrbit:
         config_manager = EnhancedConfigManager(self.config_path)
         config = config_manager.load_config()
 
-        # Start dashboard
-        dashboard = EnhancedDashboard(config, config.get('NETWORK', 'testnet'))
-        dashboard.start_dashboard()
+        # Start dashboard (Textual is only needed for this command)
+        from stacksorbit_dashboard import StacksOrbitDashboard
+        StacksOrbitDashboard(config=config, network=config.get('NETWORK', 'testnet')).run()
 
         return 0
 
@@ -995,7 +1022,7 @@ class UltimateStacksOrbit:
 
             # Check Node.js dependencies
             try:
-                result = subprocess.run(['node', '--version'], capture_output=True, timeout=5)
+                result = _run_tool(['node', '--version'], 5)
                 if result.returncode == 0:
                     print(f"{Fore.GREEN}✅ Node.js available{Style.RESET_ALL}")
                 else:
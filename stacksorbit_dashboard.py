@@ -3,11 +3,12 @@
 Enhanced Monitoring Dashboard for StacksOrbit (Textual Version)
 """
 import asyncio
+import collections
 import json
 from pathlib import Path
 import sys
 import time
-from typing import Dict
+from typing import Dict, List, NamedTuple, Optional
 from textual.binding import Binding
 from textual.widgets import Label, Button, DataTable, Footer, Header, Pretty, TabbedContent, TabPane
 from textual.app import App, ComposeResult
@@ -16,8 +17,26 @@ from textual.reactive import reactive
 from textual.worker import Worker, get_current_worker
 from textual import on
 from deployment_monitor import DeploymentMonitor
+from stx_units import format_stx, parse_micro_stx
 from enhanced_conxian_deployment import EnhancedConfigManager
 
+REFRESH_INTERVAL = 5  # Seconds between dashboard refreshes
+CONTRACTS_TTL = 60  # Seconds a deployed-contract list is shown before refetching
+ERROR_RATE_WINDOW = 120  # Refreshes the analytics error rate covers (10 minutes)
+
+# Label markup, built once instead of per refresh
+_STATUS_MARKUP = "[bold green]{}[/]"
+_ERROR_MARKUP = "[bold red]Error: {}[/]"
+
+
+class DashboardSnapshot(NamedTuple):
+    """One refresh worth of dashboard data, replaced as a whole."""
+    api_status: Dict
+    account_info: Optional[Dict]
+    deployed_contracts: List[Dict]
+    transactions: List[Dict]
+
+
 class StacksOrbitDashboard(App):
     """A Textual dashboard for StacksOrbit."""
 
@@ -33,7 +52,13 @@ class StacksOrbitDashboard(App):
         self.network = network
         self.monitor = DeploymentMonitor(network, config)
         self.address = self.config.get('SYSTEM_ADDRESS', 'Not configured')
-        self.data = {}
+        self.data: Optional[DashboardSnapshot] = None  # Last published refresh
+        self._label_text: Dict[str, str] = {}  # Last text set on each label, by selector
+        self._table_sources: Dict[int, List[Dict]] = {}  # List each DataTable was filled from
+        self._deployed_contracts = []
+        self._contracts_fetched_at = None  # time.monotonic() of the last contract fetch
+        self._refreshes = 0
+        self._recent_failures = collections.deque(maxlen=ERROR_RATE_WINDOW)  # 1 per failed refresh, else 0
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -72,6 +97,10 @@ class StacksOrbitDashboard(App):
 
     def on_mount(self) -> None:
         """Called when the app is mounted."""
+        # Columns are fixed, so they are set up once; refreshes only replace rows
+        contracts_table, transactions_table = self.query("DataTable")
+        contracts_table.add_columns("Contract ID", "Status")
+        transactions_table.add_columns("TX ID", "Type", "Status")
         self.update_data()
 
     @on(Button.Pressed)
@@ -88,47 +117,117 @@ class StacksOrbitDashboard(App):
         """Background worker to update data."""
         while True:
             try:
-                # API Status
-                api_status = self.monitor.check_api_status()
-                self.query_one("#api_status").update(f"[bold green]{api_status.get('status', 'unknown').upper()}[/]")
-                self.query_one("#block_height").update(str(api_gstatus.get('block_height', 0)))
-
-                # Account Info
-                account_info = self.monitor.get_account_info(self.address)
-                if account_info:
-                    balance_stx = int(account_info.get('balance', 0)) / 1_000_000
-                    self.query_one("#balance").update(f"{balance_stx:,.6f} STX")
-                    self.query_one("#nonce").update(str(account_info.get('nonce', 0)))
-
-                # Deployed Contracts
-                deployed_contracts = self.monitor.get_deployed_contracts(self.address)
-                contracts_table = self.query("DataTable")[0]
-                contracts_table.clear(columns=True)
-                contracts_table.add_columns("Contract ID", "Status")
-                for contract in deployed_contracts:
-                    status = "✅" # Simplified for demo
-                    contracts_table.add_row(contract.get('contract_id', 'unknown'), status)
-
-                # Network Info
-                network_info = self.monitor.check_api_status()
-                self.query("Pretty")[0].update(network_info)
-
-                # Transactions
-                transactions = self.monitor.get_recent_transactions(self.address)
-                transactions_table = self.query("DataTable")[1]
-                transactions_table.clear(columns=True)
-                transactions_table.add_columns("TX ID", "Type", "Status")
-                for tx in transactions:
-                    transactions_table.add_row(
-                        tx.get('tx_id', 'unknown')[:10] + "...",
-                        tx.get('tx_type', 'unknown'),
-                        tx.get('tx_status', 'unknown')
-                    )
+                # Fetch everything first, then publish and render one snapshot,
+                # so the widgets never show a half-updated refresh; an identical
+                # refresh leaves the screen alone
+                snapshot = await self._fetch_snapshot()
+                if snapshot != self.data:
+                    self.data = snapshot
+                    self._show_snapshot(snapshot)
+                failed = snapshot.api_status.get('status') != 'online'
 
             except Exception as e:
-                self.query_one("#api_status").update(f"[bold red]Error: {e}[/]")
-
-            await asyncio.sleep(5)
+                self._set_label("#api_status", _ERROR_MARKUP.format(e))
+                self.data = None  # Repaint fully once refreshes recover
+                failed = True
+
+            self._record_refresh(failed)
+            await asyncio.sleep(REFRESH_INTERVAL)
+
+    def _record_refresh(self, failed: bool) -> None:
+        """Count a refresh and show the error rate over the recent window."""
+        self._refreshes += 1
+        self._recent_failures.append(int(failed))
+        error_rate = 100 * sum(self._recent_failures) / len(self._recent_failures)
+        self.query("Pretty")[1].update({
+            'refreshes': self._refreshes,
+            'recent_error_rate': f"{error_rate:.1f}%",
+            'window': len(self._recent_failures)
+        })
+
+    async def _fetch_snapshot(self) -> DashboardSnapshot:
+        """Fetch one refresh worth of data."""
+        loop = asyncio.get_running_loop()
+
+        # The monitor blocks on HTTP, so issue the calls concurrently off
+        # the event loop; a refresh then costs the slowest call, not the sum
+        fetches = [
+            loop.run_in_executor(None, self.monitor.check_api_status),
+            loop.run_in_executor(None, self.monitor.get_account_info, self.address),
+            loop.run_in_executor(None, self.monitor.get_recent_transactions, self.address)
+        ]
+
+        # The contract list rarely changes: keep showing the last one
+        # and only refetch it once it is older than CONTRACTS_TTL
+        if (self._contracts_fetched_at is None
+                or time.monotonic() - self._contracts_fetched_at > CONTRACTS_TTL):
+            fetches.append(loop.run_in_executor(None, self._fetch_contracts))
+
+        api_status, account_info, transactions, *fetched_contracts = await asyncio.gather(*fetches)
+        # A failed fetch keeps the last good list and is retried next refresh
+        if fetched_contracts and fetched_contracts[0] is not None:
+            self._deployed_contracts = fetched_contracts[0]
+            self._contracts_fetched_at = time.monotonic()
+
+        return DashboardSnapshot(api_status, account_info, self._deployed_contracts, transactions)
+
+    def _fetch_contracts(self) -> Optional[List[Dict]]:
+        """Deployed contracts, or None if the lookup failed."""
+        try:
+            return self.monitor.get_deployed_contracts(self.address, raise_errors=True)
+        except Exception:
+            return None
+
+    def _show_snapshot(self, snapshot: DashboardSnapshot) -> None:
+        """Show a snapshot in the widgets."""
+        # API Status
+        api_status = snapshot.api_status
+        self._set_label("#api_status", _STATUS_MARKUP.format(api_status.get('status', 'unknown').upper()))
+        self._set_label("#block_height", str(api_status.get('block_height', 0)))
+
+        # Account Info
+        account_info = snapshot.account_info
+        if account_info:
+            self._set_label("#balance", format_stx(parse_micro_stx(account_info.get('balance', 0))))
+            self._set_label("#nonce", str(account_info.get('nonce', 0)))
+
+        # Deployed Contracts
+        status = "✅" # Simplified for demo
+        self._fill_table(0, snapshot.deployed_contracts, (
+            (contract.get('contract_id', 'unknown'), status) for contract in snapshot.deployed_contracts
+        ))
+
+        # Network Info
+        self.query("Pretty")[0].update(api_status)
+
+        # Transactions
+        self._fill_table(1, snapshot.transactions, (
+            (
+                tx.get('tx_id', 'unknown')[:10] + "...",
+                tx.get('tx_type', 'unknown'),
+                tx.get('tx_status', 'unknown')
+            )
+            for tx in snapshot.transactions
+        ))
+
+    def _fill_table(self, index: int, source: List[Dict], rows) -> None:
+        """Replace a table's rows, unless it already shows this exact list.
+
+        The monitor hands back the same list object while a response is
+        cached or unchanged (ETag), so identity marks an unchanged table.
+        """
+        if self._table_sources.get(index) is source:
+            return
+        table = self.query("DataTable")[index]
+        table.clear()
+        table.add_rows(rows)
+        self._table_sources[index] = source
+
+    def _set_label(self, selector: str, text: str) -> None:
+        """Update a label only when its text changed, sparing Textual a repaint."""
+        if self._label_text.get(selector) != text:
+            self.query_one(selector).update(text)
+            self._label_text[selector] = text
 
 def main():
     """Main dashboard CLI function."""
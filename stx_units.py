@@ -0,0 +1,18 @@
+"""
+STX Amount Helpers
+Exact microSTX parsing and formatting shared by the monitor, dashboard and auto-detector
+"""
+
+MICRO_STX = 1_000_000  # microSTX per STX
+
+
+def parse_micro_stx(value) -> int:
+    """Read a microSTX amount; /v2/accounts reports balances as 0x-prefixed hex"""
+    return int(value, 0) if isinstance(value, str) else int(value)
+
+
+def format_stx(micro_stx: int) -> str:
+    """Format a microSTX amount as exact STX with six decimals, without floats"""
+    whole, frac = divmod(abs(micro_stx), MICRO_STX)
+    sign = '-' if micro_stx < 0 else ''
+    return f"{sign}{whole:,}.{frac:06d} STX"
@@ -0,0 +1,304 @@
+import asyncio
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import deployment_monitor
+from deployment_monitor import DeploymentMonitor
+
+ADDRESS = "ST1PQHQKV0RJXZFY1DGX8MNSNYVE3VGZJSRTPGZGM"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def make_monitor(cls=DeploymentMonitor, **config):
+    config.setdefault('SAVE_LOGS', 'false')
+    return cls('testnet', config)
+
+
+@pytest.mark.skipif(not deployment_monitor.HAS_AIOHTTP, reason="aiohttp not installed")
+def test_async_monitoring_status_gathers_all_endpoints():
+    monitor = make_monitor(deployment_monitor.AsyncDeploymentMonitor, SYSTEM_ADDRESS=ADDRESS)
+    responses = {
+        "/v2/info": {'stacks_tip_height': 42, 'network_id': 2147483648},
+        f"/v2/accounts/{ADDRESS}": {'balance': '0x10', 'nonce': 3},
+        f"/v2/accounts/{ADDRESS}/contracts": {'contracts': [{'contract_id': f"{ADDRESS}.token"}]},
+    }
+
+    async def fake_get_json(path, timeout=None):
+        return responses[path]
+
+    monitor._get_json = fake_get_json
+    status = asyncio.run(monitor.get_monitoring_status())
+
+    assert status['api_status']['block_height'] == 42
+    assert status['account_info']['nonce'] == 3
+    assert status['deployed_contracts'] == 1
+
+
+@pytest.mark.skipif(not deployment_monitor.HAS_AIOHTTP, reason="aiohttp not installed")
+def test_async_monitor_does_not_inherit_sync_entry_points():
+    monitor = make_monitor(deployment_monitor.AsyncDeploymentMonitor)
+
+    assert not isinstance(monitor, DeploymentMonitor)
+    for name in ('_polling_loop', '_stream_loop', 'iter_deployed_contracts', '_fan_out'):
+        assert not hasattr(monitor, name)
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    @property
+    def content(self):
+        if self._payload is None:
+            raise AssertionError("body decoded on a 304")
+        return json.dumps(self._payload).encode()
+
+    @property
+    def raw(self):
+        return io.BytesIO(self.content)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return self.responses.pop(0)
+
+
+def use_fake_session(monkeypatch, responses):
+    session = FakeSession(responses)
+    monkeypatch.setattr(deployment_monitor._thread_sessions, 'session', session, raising=False)
+    return session
+
+
+def test_account_info_revalidates_with_etag(monkeypatch):
+    monitor = make_monitor()
+    session = use_fake_session(monkeypatch, [
+        FakeResponse(200, {'nonce': 5}, {'ETag': '"abc"'}),
+        FakeResponse(304),
+    ])
+
+    assert monitor.get_account_info(ADDRESS) == {'nonce': 5}
+    assert monitor.get_account_info(ADDRESS) == {'nonce': 5}
+    assert session.requests[1][1]['headers'] == {'If-None-Match': '"abc"'}
+
+    monitor.invalidate_account_cache(ADDRESS)
+    assert ADDRESS not in monitor._account_cache
+
+
+def test_stream_event_records_confirmed_deployment():
+    monitor = make_monitor(SYSTEM_ADDRESS=ADDRESS)
+    event = {
+        'jsonrpc': '2.0',
+        'method': 'address_tx_update',
+        'params': {'address': ADDRESS, 'tx_status': 'success', 'tx': {'nonce': 0, 'sender_address': ADDRESS}},
+    }
+
+    assert monitor._handle_stream_event(event) is True
+    assert monitor.deployment_history[0]['nonce'] == 1
+
+    pending = dict(event, params=dict(event['params'], tx_status='pending'))
+    assert monitor._handle_stream_event(pending) is False
+
+
+def test_stream_event_ignores_inbound_transactions():
+    monitor = make_monitor(SYSTEM_ADDRESS=ADDRESS)
+    inbound = {
+        'jsonrpc': '2.0',
+        'method': 'address_tx_update',
+        'params': {
+            'address': ADDRESS,
+            'tx_status': 'success',
+            'tx': {'nonce': 41, 'sender_address': "ST2CY5V39NHDPWSXMW9QDT3HC3GD6Q6XX4CFRK9AG"},
+        },
+    }
+
+    assert monitor._handle_stream_event(inbound) is False
+    assert monitor.deployment_history == []
+
+
+def test_monitoring_status_uses_per_thread_sessions():
+    monitor = make_monitor(SYSTEM_ADDRESS=ADDRESS)
+    monitor.check_api_status = lambda: {'status': 'online'}
+    monitor.get_account_info = lambda address: {'nonce': 1}
+    monitor.get_deployed_contracts = lambda address: [{}, {}]
+
+    status = monitor.get_monitoring_status()
+
+    assert status['api_status'] == {'status': 'online'}
+    assert status['account_info'] == {'nonce': 1}
+    assert status['deployed_contracts'] == 2
+
+    sessions = monitor._fan_out(*[(lambda: id(monitor.session),)] * 8)
+    assert id(monitor.session) not in sessions
+    assert make_monitor().session is monitor.session
+
+
+def test_parse_env_matches_line_parser():
+    text = (
+        "# Deployer settings\n"
+        "NETWORK=testnet\n"
+        'SYSTEM_ADDRESS="ST1PQHQKV0RJXZFY1DGX8MNSNYVE3VGZJSRTPGZGM"\n'
+        "  LOG_LEVEL = DEBUG  \n"
+        "\n"
+        "NOT A PAIR\n"
+        "EMPTY=\n"
+    )
+
+    assert deployment_monitor._parse_env(text) == {
+        'NETWORK': 'testnet',
+        'SYSTEM_ADDRESS': ADDRESS,
+        'LOG_LEVEL': 'DEBUG',
+        'EMPTY': '',
+    }
+
+
+def test_estimate_costs_classifies_balance():
+    assert deployment_monitor._estimate_costs(0.5, 20) == (10.0, deployment_monitor.FUNDS_INSUFFICIENT)
+    assert deployment_monitor._estimate_costs(5.0, 20) == (10.0, deployment_monitor.FUNDS_LIMITED)
+    assert deployment_monitor._estimate_costs(10.0, 20) == (10.0, deployment_monitor.FUNDS_SUFFICIENT)
+
+
+def test_stop_monitoring_wakes_polling_thread():
+    monitor = make_monitor()
+    monitor.check_api_status = lambda: {'status': 'online'}
+
+    thread = monitor.start_monitoring()
+    monitor.stop_monitoring()
+    thread.join(timeout=2)
+
+    assert not thread.is_alive()
+
+
+def test_stop_monitoring_shuts_down_worker_pool():
+    monitor = make_monitor(SYSTEM_ADDRESS=ADDRESS)
+    monitor.check_api_status = lambda: {'status': 'online'}
+    monitor.get_account_info = lambda address: {'nonce': 1}
+    monitor.get_deployed_contracts = lambda address: []
+    monitor.get_monitoring_status()
+    pool = monitor._executor
+
+    monitor.stop_monitoring()
+
+    assert pool._shutdown
+    assert monitor.get_monitoring_status()['api_status'] == {'status': 'online'}
+    assert monitor._executor is None
+
+    monitor._stop_event.clear()
+    assert monitor._fan_out((len, "abc")) == [3]
+    assert monitor._executor is not None and monitor._executor is not pool
+    monitor.stop_monitoring()
+
+
+def test_verification_preserves_order():
+    monitor = make_monitor()
+    deployed = [{'contract_id': f"{ADDRESS}.{name}"} for name in ('token', 'router', 'oracle')]
+
+    verification = monitor._build_verification(['router', 'vault', 'token'], ADDRESS, deployed)
+
+    assert verification['verified'] == ['router', 'token']
+    assert verification['missing'] == ['vault']
+    assert verification['extra'] == ['oracle']
+    assert verification['success'] is False
+
+
+@pytest.mark.parametrize('has_ijson', [False, deployment_monitor.HAS_IJSON])
+def test_verify_deployment_streams_contract_listing(monkeypatch, has_ijson):
+    monkeypatch.setattr(deployment_monitor, 'HAS_IJSON', has_ijson)
+    monitor = make_monitor()
+    listing = {'contracts': [{'contract_id': f"{ADDRESS}.token"}, {'contract_id': f"{ADDRESS}.vault"}]}
+    session = use_fake_session(monkeypatch, [FakeResponse(200, listing)])
+
+    verification = monitor.verify_deployment(['token'], ADDRESS)
+
+    assert session.requests[0][1] == {'stream': True}
+    assert verification['verified'] == ['token']
+    assert verification['extra'] == ['vault']
+
+
+def test_color_helper_is_plain_without_terminal(monkeypatch):
+    monkeypatch.setattr(deployment_monitor, '_USE_COLORS', False)
+    assert deployment_monitor._c("Ready", deployment_monitor.Fore.GREEN) == "Ready"
+
+    monkeypatch.setattr(deployment_monitor, '_USE_COLORS', True)
+    assert deployment_monitor._c("Ready", "<g>").startswith("<g>Ready")
+
+
+def test_monitoring_duration_uses_monotonic_clock(monkeypatch):
+    monitor = make_monitor()
+    assert monitor._monitoring_duration() == 'unknown'
+
+    monitor._started_ns = 0
+    monkeypatch.setattr(deployment_monitor.time, 'monotonic_ns', lambda: 3723_500_000_000)
+    assert monitor._monitoring_duration() == "01:02:03"
+
+
+def test_recent_transactions_reads_extended_api(monkeypatch):
+    monitor = make_monitor()
+    session = use_fake_session(monkeypatch, [
+        FakeResponse(200, {'results': [{'tx_id': '0xabc', 'tx_status': 'success'}]}, {'ETag': '"v1"'}),
+        FakeResponse(304),
+        FakeResponse(500),
+    ])
+
+    assert monitor.get_recent_transactions(ADDRESS) == [{'tx_id': '0xabc', 'tx_status': 'success'}]
+    assert session.requests[0][0] == f"{monitor.api_url}/extended/v1/address/{ADDRESS}/transactions?limit=10"
+    assert monitor.get_recent_transactions(ADDRESS) == [{'tx_id': '0xabc', 'tx_status': 'success'}]
+    assert session.requests[1][1]['headers'] == {'If-None-Match': '"v1"'}
+
+    assert monitor.get_recent_transactions(ADDRESS) == []
+    assert ADDRESS not in monitor._transactions_cache
+
+
+def test_monitoring_summary_is_replaced_atomically(tmp_path):
+    monitor = make_monitor()
+    monitor.save_monitoring_summary()
+    monitor.save_monitoring_summary()
+
+    assert sorted(p.name for p in (tmp_path / "logs").iterdir()) == ["monitoring_summary.json"]
+    summary = json.loads((tmp_path / "logs" / "monitoring_summary.json").read_text())
+    assert summary['network'] == 'testnet'
+
+
+def test_stx_amounts_format_exactly():
+    assert deployment_monitor.parse_micro_stx("0x00000000000000000000000005f5e0ff") == 99_999_999
+    assert deployment_monitor.parse_micro_stx("1500000") == 1_500_000
+    assert deployment_monitor.parse_micro_stx(7) == 7
+
+    assert deployment_monitor.format_stx(1_234_567_000_001) == "1,234,567.000001 STX"
+    assert deployment_monitor.format_stx(0) == "0.000000 STX"
+    assert deployment_monitor.format_stx(-500_000) == "-0.500000 STX"
+
+
+def test_deployed_contracts_can_report_failures(monkeypatch):
+    monitor = make_monitor()
+    use_fake_session(monkeypatch, [FakeResponse(500), FakeResponse(500)])
+
+    assert monitor.get_deployed_contracts(ADDRESS) == []
+    with pytest.raises(RuntimeError):
+        monitor.get_deployed_contracts(ADDRESS, raise_errors=True)
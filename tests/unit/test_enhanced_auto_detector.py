@@ -0,0 +1,520 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import enhanced_auto_detector
+from enhanced_auto_detector import GenericStacksAutoDetector
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def write(path: Path, text: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_state_round_trips_through_json_codec(project):
+    detector = GenericStacksAutoDetector(project)
+    detector.state['contract_hashes'] = {'token': 'abc'}
+    detector._save_state()
+
+    reloaded = GenericStacksAutoDetector(project)
+
+    assert reloaded.state['contract_hashes'] == {'token': 'abc'}
+    assert reloaded.state['last_updated'] == detector.state['last_updated']
+
+
+def test_file_hash_matches_between_read_and_mmap(project, monkeypatch):
+    detector = GenericStacksAutoDetector(project)
+    contract = write(project / "contracts" / "token.clar", "(define-constant ok u1)")
+
+    read_hash = detector._calculate_file_hash(contract)
+    monkeypatch.setattr(enhanced_auto_detector, 'MMAP_HASH_THRESHOLD', 0)
+
+    assert detector._calculate_file_hash(contract) == read_hash
+    assert read_hash != detector._calculate_file_hash(write(project / "other.clar", "(ok)"))
+
+
+def test_file_fingerprint_reuses_hash_until_file_changes(project, monkeypatch):
+    detector = GenericStacksAutoDetector(project)
+    contract = write(project / "contracts" / "token.clar", "(define-constant ok u1)")
+    calls = []
+    real_hash = detector._calculate_file_hash
+    monkeypatch.setattr(detector, '_calculate_file_hash', lambda path: calls.append(path) or real_hash(path))
+
+    first = detector._file_fingerprint(contract)
+    assert detector._file_fingerprint(contract) == first
+    assert len(calls) == 1
+
+    contract.write_text("(define-constant ok u22)")
+    assert detector._file_fingerprint(contract)['hash'] != first['hash']
+    assert len(calls) == 2
+    assert detector.state['contract_hashes'][str(contract)]['size'] == contract.stat().st_size
+
+
+def test_directory_scan_reports_each_file_once(project):
+    for relative in ("contracts/token.clar", "clarinet/contracts/vault.clar", "src/math.clar", "misc/oracle.clar"):
+        write(project / relative, "(ok)")
+    detector = GenericStacksAutoDetector(project)
+
+    contracts = detector._generic_directory_scan(project)
+
+    assert [(c['name'], c['source']) for c in contracts] == [
+        ('token', 'contracts directory'),
+        ('vault', 'clarinet contracts'),
+        ('math', 'src directory'),
+        ('oracle', 'any .clar files'),
+    ]
+
+
+def test_category_and_priority_follow_declaration_order(project):
+    detector = GenericStacksAutoDetector(project)
+
+    assert detector._determine_contract_category("Governance-Token") == 'tokens'
+    assert detector._determine_contract_category("vault-governance") == 'defi'
+    assert detector._determine_contract_category("keeper") == 'general'
+    assert GenericStacksAutoDetector(project, use_conxian_mode=True)._determine_contract_category("keeper-coordinator") == 'conxian_chainhooks'
+
+    contracts = [{'name': name} for name in ("dex-router", "keeper", "sip-010-trait", "math-lib")]
+    ordered = detector._sort_contracts_by_generic_dependencies(contracts)
+    assert [c['name'] for c in ordered] == ["sip-010-trait", "math-lib", "dex-router", "keeper"]
+
+    # Earliest PRIORITY_ORDER entry wins, not the leftmost match in the name
+    ordered = detector._sort_contracts_by_generic_dependencies([{'name': "lib-core"}, {'name': "library"}])
+    assert [c['name'] for c in ordered] == ["library", "lib-core"]
+
+
+def test_sort_order_is_cached_until_directory_change(project):
+    detector = GenericStacksAutoDetector(project)
+    contracts = [{'name': name} for name in ("dex-router", "sip-010-trait")]
+    enhanced_auto_detector._priority_order.cache_clear()
+
+    first = detector._sort_contracts_by_generic_dependencies(contracts)
+    assert detector._sort_contracts_by_generic_dependencies(contracts) == first
+    assert enhanced_auto_detector._priority_order.cache_info().hits == 1
+
+    detector.handle_directory_change(project)
+    assert enhanced_auto_detector._priority_order.cache_info().hits == 0
+
+
+@pytest.mark.skipif(not enhanced_auto_detector.HAS_AHOCORASICK, reason="pyahocorasick not installed")
+def test_automaton_matches_substring_scan(project, monkeypatch):
+    names = ["governance-token", "vault-governance", "keeper", "dex-router", "sip-010-trait", "oracle-feed"]
+    matched = [enhanced_auto_detector._contract_category(name, False) for name in names]
+
+    monkeypatch.setattr(enhanced_auto_detector, '_pattern_automaton', lambda conxian_mode: None)
+    enhanced_auto_detector._contract_category.cache_clear()
+    try:
+        assert matched == [enhanced_auto_detector._contract_category(name, False) for name in names]
+    finally:
+        enhanced_auto_detector._contract_category.cache_clear()
+
+
+def test_manual_clarinet_toml_parser_reads_contract_tables(project):
+    write(project / "contracts" / "token.clar", "(ok)")
+    write(project / "contracts" / "vault.clar", "(ok)")
+    clarinet = write(project / "Clarinet.toml", (
+        "[project]\n"
+        "name = \"demo\"\n"
+        "\n"
+        "[contracts.token]\n"
+        "path = \"contracts/token.clar\"  # main token\n"
+        "clarity_version = 2\n"
+        "\n"
+        "[contracts.\"vault\"]\n"
+        "path = 'contracts/vault.clar'\n"
+        "depends_on = [\"token\"]\n"
+        "\n"
+        "[contracts.missing]\n"
+        "path = \"contracts/missing.clar\"\n"
+    ))
+    detector = GenericStacksAutoDetector(project)
+
+    contracts = detector._parse_clarinet_toml_manually(clarinet)
+
+    assert [(c['name'], c['path']) for c in contracts] == [
+        ('token', 'contracts/token.clar'),
+        ('vault', 'contracts/vault.clar'),
+    ]
+
+
+def test_prefetch_hashes_only_changed_files(project):
+    detector = GenericStacksAutoDetector(project)
+    files = [write(project / "contracts" / f"c{i}.clar", f"(ok u{i})") for i in range(4)]
+    detector._file_fingerprint(files[0])
+
+    hashed = []
+    real_hash = detector._calculate_file_hash
+    detector._calculate_file_hash = lambda path: hashed.append(path) or real_hash(path)
+    detector._prefetch_file_hashes([(f, f.stat()) for f in files])
+
+    assert sorted(hashed) == files[1:]
+    assert all(detector._cached_file_hash(f, f.stat()) == real_hash(f) for f in files)
+
+
+def test_directory_scan_prunes_dependency_trees(project):
+    write(project / "contracts" / "token.clar", "(ok)")
+    write(project / "node_modules" / "pkg" / "vendored.clar", "(ok)")
+    write(project / ".git" / "stray.clar", "(ok)")
+
+    names = [c['name'] for c in GenericStacksAutoDetector(project)._generic_directory_scan(project)]
+
+    assert names == ['token']
+
+
+def test_clarinet_toml_falls_back_to_manual_parser_without_toml_module(project, monkeypatch):
+    write(project / "contracts" / "token.clar", "(ok)")
+    write(project / "Clarinet.toml", "[project]\nname = \"demo\"\n\n[contracts.token]\npath = \"contracts/token.clar\"\n")
+    detector = GenericStacksAutoDetector(project)
+
+    parsed = detector._parse_generic_clarinet_toml(project)
+    monkeypatch.setattr(enhanced_auto_detector, 'tomllib', None)
+    monkeypatch.setattr(enhanced_auto_detector, 'toml', None)
+    enhanced_auto_detector._parse_toml_file.cache_clear()
+
+    assert [c['name'] for c in detector._parse_generic_clarinet_toml(project)] == [c['name'] for c in parsed] == ['token']
+    assert detector._analyze_clarinet_toml(project)['version'] == 'manual_parse'
+
+
+def test_state_changes_are_appended_then_compacted(project, monkeypatch):
+    detector = GenericStacksAutoDetector(project)
+    detector._save_state()
+    snapshot = detector.state_file.read_bytes()
+
+    contract = write(project / "contracts" / "token.clar", "(ok)")
+    detector._file_fingerprint(contract)
+    detector.state['last_scan'] = 123
+    detector._save_state()
+
+    assert detector.state_file.read_bytes() == snapshot
+    assert len(detector.state_log.read_bytes().splitlines()) == 2
+    reloaded = GenericStacksAutoDetector(project)
+    assert reloaded.state['contract_hashes'] == detector.state['contract_hashes']
+    assert reloaded.state['last_scan'] == 123
+
+    monkeypatch.setattr(enhanced_auto_detector, 'STATE_COMPACT_EVERY', 3)
+    reloaded._save_state()
+
+    assert not reloaded.state_log.exists()
+    assert GenericStacksAutoDetector(project).state['contract_hashes'] == detector.state['contract_hashes']
+
+
+def test_torn_state_log_tail_is_truncated_so_later_saves_survive(project):
+    detector = GenericStacksAutoDetector(project)
+    detector._save_state()
+    detector.state['last_scan'] = 1
+    detector._save_state()
+    with open(detector.state_log, 'ab') as f:
+        f.write(b'{"op": "state", "fie')
+
+    recovered = GenericStacksAutoDetector(project)
+    assert recovered.state['last_scan'] == 1
+    recovered.state['last_scan'] = 2
+    recovered._save_state()
+
+    assert GenericStacksAutoDetector(project).state['last_scan'] == 2
+
+
+def test_deployment_artifacts_are_found_once(project):
+    write(project / "deployment" / "manifest.json", '{"deployment": {"successful": [{"name": "token"}]}}')
+    write(project / "build" / "deployments.json", "{}")
+    write(project / "build" / "release.deployment", "{}")
+    write(project / "build" / "package.json", "{}")
+    detector = GenericStacksAutoDetector(project)
+
+    artifacts = sorted(Path(a['path']).relative_to(project).as_posix() for a in detector._find_deployment_artifacts(project))
+    manifests = detector._parse_deployment_manifests(project)
+
+    assert artifacts == ["build/deployments.json",
+                         "build/release.deployment", "deployment/manifest.json"]
+    assert [m['name'] for m in manifests] == ['token']
+
+
+@pytest.mark.parametrize('has_ijson', [False, enhanced_auto_detector.HAS_IJSON])
+def test_manifest_contracts_are_read_with_or_without_ijson(project, monkeypatch, has_ijson):
+    monkeypatch.setattr(enhanced_auto_detector, 'HAS_IJSON', has_ijson)
+    write(project / "deployment" / "testnet.json",
+          '{"network": "testnet", "deployment": {"successful": [{"name": "token", "tx_id": "0x1"}, {"name": "vault"}]}}')
+    write(project / "deployment" / "notes.json", '{"network": "testnet"}')
+    detector = GenericStacksAutoDetector(project)
+
+    manifests = detector._parse_deployment_manifests(project)
+
+    assert [(m['name'], m['tx_id']) for m in manifests] == [('token', '0x1'), ('vault', '')]
+
+
+def test_detection_result_is_reused_across_runs_until_tree_changes(project, monkeypatch):
+    contract = write(project / "contracts" / "token.clar", "(ok)")
+    detector = GenericStacksAutoDetector(project)
+    first = detector._comprehensive_generic_contract_detection(project)
+    detector._save_state()
+
+    rerun = GenericStacksAutoDetector(project)
+    monkeypatch.setattr(rerun, '_generic_directory_scan', lambda directory: pytest.fail("rescanned"))
+    assert rerun._comprehensive_generic_contract_detection(project) == first
+
+    contract.write_text("(ok u2)")
+    rescanned = GenericStacksAutoDetector(project)._comprehensive_generic_contract_detection(project)
+    assert rescanned[0]['hash'] != first[0]['hash']
+
+
+def test_cached_detection_sees_contracts_added_to_nested_directories(project):
+    write(project / "contracts" / "dex" / "router.clar", "(ok)")
+    detector = GenericStacksAutoDetector(project)
+    detector._comprehensive_generic_contract_detection(project)
+    detector._save_state()
+
+    write(project / "contracts" / "dex" / "pool.clar", "(ok)")
+    rescanned = GenericStacksAutoDetector(project)._comprehensive_generic_contract_detection(project)
+
+    assert sorted(c['name'] for c in rescanned) == ['pool', 'router']
+
+
+def test_cached_detection_is_kept_per_mode(project):
+    write(project / "contracts" / "keeper-coordinator.clar", "(ok)")
+    generic = GenericStacksAutoDetector(project)
+    assert generic._comprehensive_generic_contract_detection(project)[0]['category'] == 'general'
+    generic._save_state()
+
+    conxian = GenericStacksAutoDetector(project, use_conxian_mode=True)
+    assert conxian._comprehensive_generic_contract_detection(project)[0]['category'] == 'conxian_chainhooks'
+
+
+def test_clarinet_toml_is_parsed_once_per_modification(project):
+    write(project / "Clarinet.toml", "[project]\nname = \"demo\"\n\n[contracts.token]\npath = \"contracts/token.clar\"\n")
+    enhanced_auto_detector._parse_toml_file.cache_clear()
+    detector = GenericStacksAutoDetector(project)
+
+    detector._parse_generic_clarinet_toml(project)
+    analysis = detector._analyze_clarinet_toml(project)
+
+    assert analysis['project_name'] == 'demo'
+    assert analysis['contracts'] == 1
+    assert enhanced_auto_detector._parse_toml_file.cache_info().misses == 1
+
+
+ADDRESS = "ST1PQHQKV0RJXZFY1DGX8MNSNYVE3VGZJSRTPGZGM"
+
+
+def write_env(project: Path) -> Path:
+    return write(project / ".env", (
+        "# Deployer settings\n"
+        f"DEPLOYER_PRIVKEY={'a' * 64}\n"
+        f'SYSTEM_ADDRESS="{ADDRESS}"\n'
+        "NETWORK = testnet\n"
+    ))
+
+
+def test_env_file_is_read_once_for_all_config_lookups(project, monkeypatch):
+    env = write_env(project)
+    detector = GenericStacksAutoDetector(project)
+    reads = []
+    real_read_text = Path.read_text
+    monkeypatch.setattr(Path, 'read_text', lambda self, *a, **k: reads.append(self) or real_read_text(self, *a, **k))
+
+    status = detector._check_configuration(project)
+
+    assert status['network'] == 'testnet'
+    assert detector._extract_address_from_config() == ADDRESS
+    assert reads == [env]
+
+
+def test_local_deployment_status_collects_history_and_manifests_in_one_walk(project):
+    write(project / "deployment" / "history.json", '[{"name": "token"}]')
+    write(project / ".stacksorbit" / "deployment_history.json", '[{"name": "vault"}]')
+    write(project / "deployment" / "manifest.json", '{"deployment": {"successful": []}}')
+    write(project / "envs" / "testnet-manifest.json", '{"network": "testnet"}')
+    write(project / "envs" / "manifest.json", '{"ignored": true}')
+    write(project / "node_modules" / "pkg" / "deployment_history.json", '[{"name": "vendored"}]')
+
+    status = GenericStacksAutoDetector(project)._check_local_deployment_status()
+
+    assert sorted(h['name'] for h in status['deployment_history']) == ['token', 'vault']
+    assert len(status['manifests']) == 2
+
+
+def test_non_list_history_file_is_skipped(project, caplog):
+    write(project / "deployment" / "history.json", '[{"name": "token"}]')
+    write(project / ".stacksorbit" / "deployment_history.json", 'null')
+    write(project / "pkg" / "deployment_history.json", '42')
+
+    status = GenericStacksAutoDetector(project)._check_local_deployment_status()
+
+    assert [h['name'] for h in status['deployment_history']] == ['token']
+    assert sum('expected a list' in record.getMessage() for record in caplog.records) == 2
+
+
+def test_local_deployment_status_does_not_expose_cached_parses(project):
+    write(project / "deployment" / "history.json", '[{"name": "token"}]')
+    write(project / "deployment" / "manifest.json", '{"deployment": {"successful": []}}')
+    detector = GenericStacksAutoDetector(project)
+
+    status = detector._check_local_deployment_status()
+    status['deployment_history'][0]['name'] = 'MUTATED'
+    status['manifests'][0]['deployment']['successful'].append({'name': 'MUTATED'})
+
+    again = detector._check_local_deployment_status()
+    assert again['deployment_history'] == [{'name': 'token'}]
+    assert again['manifests'] == [{'deployment': {'successful': []}}]
+
+
+def test_local_deployment_files_are_parsed_once_while_unchanged(project):
+    history = write(project / "deployment" / "history.json", '[{"name": "token"}]')
+    detector = GenericStacksAutoDetector(project)
+    enhanced_auto_detector._parse_json_file.cache_clear()
+
+    detector._check_local_deployment_status()
+    detector._check_local_deployment_status()
+    assert enhanced_auto_detector._parse_json_file.cache_info().misses == 1
+
+    history.write_text('[{"name": "token"}, {"name": "vault"}]')
+    assert len(detector._check_local_deployment_status()['deployment_history']) == 2
+
+
+def test_deployment_analysis_computes_skip_list_once(project, monkeypatch):
+    write(project / "deployment" / "manifest.json",
+          '{"deployment": {"successful": [{"name": "token"}]}}')
+    write(project / "contracts" / "token.clar", "(ok)")
+    write(project / "contracts" / "vault.clar", "(ok)")
+    detector = GenericStacksAutoDetector(project)
+    detector._comprehensive_generic_contract_detection(project)
+    calls = []
+    real_skip = detector._get_contracts_to_skip
+    monkeypatch.setattr(detector, '_get_contracts_to_skip', lambda *args: calls.append(args) or real_skip(*args))
+
+    analysis = detector._analyze_deployment_status()
+
+    assert len(calls) == 1
+    assert analysis['contracts_to_skip'] == ['token']
+    assert analysis['contracts_to_deploy'] == ['vault']
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode()
+
+
+class FakeSession:
+    def __init__(self, balances):
+        self.balances = balances
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        address = url.rsplit('/', 1)[-1]
+        if address not in self.balances:
+            return FakeResponse(404, {})
+        return FakeResponse(200, {'balance': self.balances[address], 'locked': '0x0000000000000000000000000007a120'})
+
+
+def test_wallet_balance_reads_hex_amounts(project, monkeypatch):
+    write(project / ".env", f"DEPLOYER_PRIVKEY={'a' * 64}\nSYSTEM_ADDRESS={ADDRESS}\nNETWORK=testnet\n")
+    session = FakeSession({ADDRESS: '0x000000000000000000000000002625a0'})
+    monkeypatch.setattr(enhanced_auto_detector, '_get_http_session', lambda: session)
+
+    status = GenericStacksAutoDetector(project)._check_wallet_balance()
+
+    assert status['has_balance'] is True
+    assert (status['balance_stx'], status['available_stx'], status['locked_stx']) == (2.5, 2.0, 0.5)
+
+
+def test_state_snapshot_is_replaced_atomically(project, monkeypatch):
+    detector = GenericStacksAutoDetector(project)
+    detector._save_state()
+    snapshot = detector.state_file.read_bytes()
+
+    def crash(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(enhanced_auto_detector.os, 'replace', crash)
+    detector.state['last_scan'] = 1
+    with pytest.raises(OSError):
+        detector._compact_state()
+
+    assert detector.state_file.read_bytes() == snapshot
+    assert b'\n' not in snapshot.strip()
+
+
+def test_skip_set_is_memoized_per_status(project):
+    detector = GenericStacksAutoDetector(project)
+    local_status = {'manifests': [{'deployment': {'successful': [{'name': 'token'}]}}]}
+    blockchain_status = {'deployed_contracts': ['vault']}
+
+    skip = detector._get_contracts_to_skip(local_status, blockchain_status)
+
+    assert skip == frozenset({'token', 'vault'})
+    assert detector._get_contracts_to_skip(local_status, blockchain_status) is skip
+    assert detector._get_contracts_to_skip(dict(local_status), blockchain_status) is not skip
+
+
+def test_estimate_total_gas_weights_categories(project):
+    contracts = [{'category': 'defi'}, {'category': 'oracle'}, {'category': 'utilities'}, {'category': 'general'}, {}]
+
+    assert GenericStacksAutoDetector(project)._estimate_total_gas(contracts) == pytest.approx(1.8 + 1.3 + 1.1 + 1.0 + 1.0)
+
+
+def test_extract_address_validates_format(project):
+    detector = GenericStacksAutoDetector(project)
+    env = write_env(project)
+    assert detector._extract_address_from_config() == ADDRESS
+
+    env.write_text(f"SYSTEM_ADDRESS='{ADDRESS}'\n")
+    detector._config_cache.clear()
+    assert detector._extract_address_from_config() == ADDRESS
+
+    env.write_text(f"SYSTEM_ADDRESS={ADDRESS.lower()}\n")
+    detector._config_cache.clear()
+    assert detector._extract_address_from_config() is None
+
+
+def test_config_file_is_discovered_once_per_directory(project, monkeypatch):
+    detector = GenericStacksAutoDetector(project)
+    write(project / "config.env", f"SYSTEM_ADDRESS={ADDRESS}\n")
+    probes = []
+    is_file = Path.is_file
+    monkeypatch.setattr(Path, 'is_file', lambda self: probes.append(self.name) or is_file(self))
+
+    assert detector._check_configuration(project)['config_file'] == "config.env"
+    assert detector._extract_address_from_config() == ADDRESS
+    assert probes == [".env", "config.env"]
+
+    write_env(project)
+    detector._config_paths.clear()
+    assert detector._find_config(project) == project / ".env"
+
+
+def test_missing_config_is_found_once_created(project):
+    detector = GenericStacksAutoDetector(project)
+    assert detector._find_config(project) is None
+
+    write(project / "config.env", f"SYSTEM_ADDRESS={ADDRESS}\n")
+    assert detector._find_config(project) == project / "config.env"
+
+
+def test_quiet_detector_prints_nothing(project, capsys):
+    write(project / "contracts" / "token.clar", "(ok)")
+
+    GenericStacksAutoDetector(project, quiet=True).detect_and_analyze()
+    assert capsys.readouterr().out == ""
+
+    GenericStacksAutoDetector(project).detect_and_analyze()
+    assert "Analyzing deployment status" in capsys.readouterr().out
+
+
+def test_import_does_not_load_deployment_monitor():
+    import subprocess
+
+    root = Path(__file__).resolve().parents[2]
+    code = "import sys, enhanced_auto_detector; print('deployment_monitor' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,143 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import launch_cost_estimator
+from launch_cost_estimator import LaunchCostEstimator
+
+
+def test_estimators_share_the_static_tables():
+    first, second = LaunchCostEstimator(), LaunchCostEstimator()
+
+    assert first.contracts is second.contracts is launch_cost_estimator._CONTRACTS
+    assert first.launch_phases is second.launch_phases is launch_cost_estimator._PHASES
+    assert first.contracts['dex-router'].dependencies == ('dex-factory', 'cxd-token')
+
+
+def test_total_cost_summary_is_precomputed_and_copied():
+    estimator = LaunchCostEstimator()
+    total = estimator.estimate_total_launch_cost()
+
+    assert total['total_funding_required'] == sum(p.max_funding for p in estimator.launch_phases.values())
+    assert total['bootstrap_cost'] == 100
+
+    total['phases'] = 0
+    assert estimator.estimate_total_launch_cost()['phases'] == len(estimator.launch_phases)
+
+
+def test_deploy_order_respects_dependencies():
+    estimator = LaunchCostEstimator()
+    order = estimator.get_deploy_order()
+    position = {name: index for index, name in enumerate(order)}
+
+    assert sorted(order) == sorted(estimator.contracts)
+    for contract in estimator.contracts.values():
+        assert all(position[dep] < position[contract.name] for dep in contract.dependencies)
+    assert estimator.get_missing_dependencies() == frozenset()
+
+
+def test_cost_breakdown_groups_contracts_by_category():
+    estimator = LaunchCostEstimator()
+    breakdown = estimator.generate_launch_roadmap()['cost_breakdown']
+    breakdown['oracle'].clear()
+
+    breakdown = estimator.generate_launch_roadmap()['cost_breakdown']
+    assert [entry['name'] for entry in breakdown['oracle']] == ['oracle', 'oracle-aggregator']
+    assert sum(len(entries) for entries in breakdown.values()) == len(estimator.contracts)
+
+
+def test_complexity_score_weights_each_contract():
+    estimator = LaunchCostEstimator()
+    weights = {'high': 3, 'medium': 2}
+    expected = sum(weights.get(c.complexity, 1) for c in estimator.contracts.values())
+
+    assert estimator.generate_launch_roadmap()['risk_assessment']['complexity_score'] == expected
+
+
+def test_phase_cost_is_memoized_per_phase(monkeypatch):
+    estimator = LaunchCostEstimator()
+    estimator.generate_launch_roadmap()
+    bootstrap = estimator.estimate_phase_cost('bootstrap')
+    monkeypatch.setattr(estimator, '_build_phase_cost', lambda phase: pytest.fail("rebuilt"))
+
+    bootstrap['contracts'][0]['stx_cost'] = 0
+    bootstrap['contracts'].clear()
+
+    again = estimator.estimate_phase_cost('bootstrap')
+    assert again['contracts'][0]['stx_cost'] == 2.0
+    assert estimator.generate_launch_roadmap()['phases']['bootstrap'] == again
+    assert estimator.estimate_phase_cost('missing') == {'error': 'Phase not found'}
+
+
+def test_detailed_phase_summary_lists_contract_rows(capsys):
+    estimator = LaunchCostEstimator()
+    launch_cost_estimator.print_phase_cost_summary(estimator.estimate_phase_cost('bootstrap'), detailed=True)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-3].split() == ['all-traits', '2000000', '2.00', 'high']
+    assert lines[-1].startswith('utils-utils')
+
+
+@pytest.mark.parametrize('has_orjson', [False, launch_cost_estimator.HAS_ORJSON])
+def test_json_output_matches_stdlib_encoding(monkeypatch, capsys, has_orjson):
+    monkeypatch.setattr(launch_cost_estimator, 'HAS_ORJSON', has_orjson)
+    roadmap = LaunchCostEstimator().generate_launch_roadmap()
+
+    launch_cost_estimator._write_json(roadmap, pretty=True)
+    assert capsys.readouterr().out == json.dumps(roadmap, indent=2) + "\n"
+
+    launch_cost_estimator._write_json(roadmap)
+    assert capsys.readouterr().out == json.dumps(roadmap, separators=(',', ':')) + "\n"
+
+
+def test_table_entries_have_no_instance_dict():
+    estimator = LaunchCostEstimator()
+
+    assert not hasattr(estimator.contracts['oracle'], '__dict__')
+    assert not hasattr(estimator.launch_phases['bootstrap'], '__dict__')
+
+
+def test_stx_amounts_are_derived_at_construction():
+    contract = launch_cost_estimator.ContractInfo(
+        name='vault', path='contracts/vault.clar', category='core', dependencies=(),
+        estimated_gas=2500000, complexity='low', launch_phase='bootstrap',
+    )
+    phase = LaunchCostEstimator().launch_phases['bootstrap']
+
+    assert contract.stx_cost == 2.5
+    assert (phase.min_stx, phase.max_stx) == (100.0, 500.0)
+
+
+def test_roadmap_milestones_are_copied_from_shared_table():
+    first = LaunchCostEstimator().generate_launch_roadmap()['milestones']
+    first[0]['funding'] = '0 STX'
+
+    second = LaunchCostEstimator().generate_launch_roadmap()['milestones']
+    assert second[0]['funding'] == '100 STX'
+    assert [m['phase'] for m in second] == list(LaunchCostEstimator().launch_phases)
+
+
+def test_roadmap_aggregates_are_built_on_first_use():
+    estimator = LaunchCostEstimator()
+    estimator.estimate_phase_cost('bootstrap')
+    assert '_cost_breakdown' not in vars(estimator)
+
+    estimator.generate_launch_roadmap()
+    assert {'_cost_breakdown', '_complexity_score'} <= set(vars(estimator))
+
+
+def test_valid_phases_match_phase_table():
+    assert launch_cost_estimator._VALID_PHASES == frozenset(LaunchCostEstimator().launch_phases)
+
+
+def test_unknown_phase_contracts_are_reported_once(caplog):
+    with caplog.at_level('WARNING', logger='launch_cost_estimator'):
+        estimator = LaunchCostEstimator()
+
+    assert any('budget-manager' in record.getMessage() for record in caplog.records)
+    names = [c['name'] for c in estimator.estimate_phase_cost('dex_core')['contracts']]
+    assert names == ['oracle', 'dex-factory']